@@ -4,13 +4,15 @@ import asyncio
 import logging
 import os
 import pathlib
+import random
 import sys
 import uuid
-from contextlib import asynccontextmanager, suppress
+from contextlib import aclosing, asynccontextmanager, suppress
 
 import aiomqtt
 import pydantic
 from fastapi import FastAPI, Header, HTTPException, WebSocket, WebSocketDisconnect
+from fastapi.websockets import WebSocketState
 from private_assistant_commons import MqttConfig, messages
 
 from app.utils import (
@@ -34,15 +36,22 @@ logger = logging.getLogger(__name__)
 
 sup_util = support_utils.SupportUtils()
 
+# Idle audio processors kept for reuse by reconnecting satellites
+PROCESSOR_POOL_MAX_SIZE = 32
+# Satellite connections served at once; reported by /acceptsConnections and enforced by the endpoint
+MAX_CONNECTIONS = 50
 
-def decode_message_payload(payload) -> str | None:
-    """Decode the message payload if it is a suitable type."""
-    if isinstance(payload, bytes | bytearray):
-        return payload.decode("utf-8")
-    if isinstance(payload, str):
-        return payload
-    logger.warning("Unexpected payload type: %s", type(payload))
-    return None
+
+def enqueue_response(queue: asyncio.Queue[messages.Response], response: messages.Response, topic: str) -> None:
+    """Put a response on a bounded satellite queue, dropping the oldest one when full."""
+    try:
+        queue.put_nowait(response)
+    except asyncio.QueueFull:
+        # AIDEV-NOTE: Drop-oldest keeps memory bounded for stalled satellites; the newest response is most relevant
+        with suppress(asyncio.QueueEmpty):
+            queue.get_nowait()
+        queue.put_nowait(response)
+        logger.warning("Output queue for %s is full, dropped oldest response", topic)
 
 
 async def listen(client: aiomqtt.Client, sup_util: support_utils.SupportUtils):
@@ -52,43 +61,50 @@ async def listen(client: aiomqtt.Client, sup_util: support_utils.SupportUtils):
     Note: If connection is lost during iteration, aiomqtt.MqttError will be raised
     and caught by the reconnection loop in lifespan().
     """
+    # pydantic-core parses bytes directly, so payloads are validated without an intermediate str
+    validate_response = messages.Response.model_validate_json
+    # Every mapped topic is a satellite output topic; the broadcast topic itself is never mapped
+    satellite_queues = sup_util.mqtt_subscription_to_queue
+    topic_queue_get = satellite_queues.get
+    broadcast_topic = sup_util.config_obj.broadcast_topic
+    # The log level is fixed at startup and listen() restarts on every reconnect, so check it once
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
+
     async for message in client.messages:
-        logger.debug("Received message: %s", message)
+        if debug_enabled:
+            logger.debug("Received message: %s", message)
+
+        payload = message.payload
+        if not isinstance(payload, bytes | bytearray | str):
+            logger.warning("Unexpected payload type: %s", type(payload))
+            continue
+
+        topic = message.topic.value
 
         # Handle broadcast messages specially - forward to all connected satellites
-        if message.topic.value == sup_util.config_obj.broadcast_topic:
-            payload_str = decode_message_payload(message.payload)
-            if payload_str is not None:
-                # Get all satellite queues (topics ending with /output)
-                satellite_queues = [
-                    (topic, queue)
-                    for topic, queue in sup_util.mqtt_subscription_to_queue.items()
-                    if topic.endswith("/output")
-                ]
-
-                if satellite_queues:
-                    try:
-                        response = messages.Response.model_validate_json(payload_str)
-                        for _, queue in satellite_queues:
-                            await queue.put(response)
-                        logger.info("Broadcast message forwarded to %d satellite(s)", len(satellite_queues))
-                    except pydantic.ValidationError:
-                        logger.error("Broadcast message failed validation. %s", payload_str)
-                else:
-                    logger.debug("Broadcast message received but no satellites connected")
+        if topic == broadcast_topic:
+            if satellite_queues:
+                try:
+                    response = validate_response(payload)
+                    # enqueue_response never awaits, so the map cannot change while fanning out
+                    for queue_topic, queue in satellite_queues.items():
+                        enqueue_response(queue, response, queue_topic)
+                    logger.info("Broadcast message forwarded to %d satellite(s)", len(satellite_queues))
+                except pydantic.ValidationError:
+                    logger.error("Broadcast message failed validation. %s", payload)
+            else:
+                logger.debug("Broadcast message received but no satellites connected")
             continue
 
         # Normal queue lookup for non-broadcast messages
-        topic_queue = sup_util.mqtt_subscription_to_queue.get(message.topic.value)
+        topic_queue = topic_queue_get(topic)
         if topic_queue is None:
             logger.warning("%s seems to have no queue. Discarding message.", message.topic)
         else:
-            payload_str = decode_message_payload(message.payload)
-            if payload_str is not None:
-                try:
-                    await topic_queue.put(messages.Response.model_validate_json(payload_str))
-                except pydantic.ValidationError:
-                    logger.error("Message failed validation. %s", payload_str)
+            try:
+                enqueue_response(topic_queue, validate_response(payload), topic)
+            except pydantic.ValidationError:
+                logger.error("Message failed validation. %s", payload)
 
 
 @asynccontextmanager
@@ -128,8 +144,14 @@ async def lifespan(app: FastAPI):  # noqa: ARG001
                     sup_util.mqtt_client = client
                     sup_util.mqtt_connected = True
 
-                    # Subscribe to broadcast topic
-                    await client.subscribe(sup_util.config_obj.broadcast_topic, qos=1)
+                    # Subscribe to broadcast topic and restore satellite topics still registered from before
+                    # the reconnect, all in a single SUBSCRIBE packet
+                    await client.subscribe(
+                        [
+                            (sup_util.config_obj.broadcast_topic, 1),
+                            *((topic, 1) for topic in sup_util.mqtt_subscription_to_queue),
+                        ]
+                    )
                     logger.info("MQTT connected successfully")
                     reconnect_delay = 5  # Reset backoff on successful connection
 
@@ -138,24 +160,33 @@ async def lifespan(app: FastAPI):  # noqa: ARG001
 
             except aiomqtt.MqttError as e:
                 sup_util.mqtt_connected = False
-                logger.error("MQTT connection lost: %s. Reconnecting in %s seconds...", e, reconnect_delay)
-
-                # Close all active WebSocket connections
-                connections_to_close = list(sup_util.active_connections.values())
-                for websocket in connections_to_close:
-                    try:
-                        await websocket.close(code=1011, reason="MQTT connection lost")
+                # Jitter the delay so ground stations sharing a broker do not reconnect in lockstep
+                sleep_for = reconnect_delay * random.uniform(0.5, 1.0)
+                logger.error("MQTT connection lost: %s. Reconnecting in %.1f seconds...", e, sleep_for)
+
+                # Close all accepted WebSocket connections concurrently. Sockets still in their handshake hold a
+                # reserved slot but cannot be closed yet; their endpoint sees mqtt_connected is False after
+                # accept() and closes them itself. Snapshot, since closing triggers cleanup that discards from the set
+                close_results = await asyncio.gather(
+                    *(
+                        websocket.close(code=1011, reason="MQTT connection lost")
+                        for websocket in tuple(sup_util.active_connections)
+                        if websocket.application_state == WebSocketState.CONNECTED
+                    ),
+                    return_exceptions=True,
+                )
+                for close_result in close_results:
+                    if isinstance(close_result, Exception):
+                        logger.warning("Error closing WebSocket: %s", close_result)
+                    else:
                         logger.info("Closed WebSocket connection due to MQTT disconnect")
-                    except Exception as close_error:
-                        logger.warning("Error closing WebSocket: %s", close_error)
 
-                await asyncio.sleep(reconnect_delay)
+                await asyncio.sleep(sleep_for)
                 # Exponential backoff with maximum limit
                 reconnect_delay = min(reconnect_delay * 2, max_reconnect_delay)
 
     # Start the connection task
-    loop = asyncio.get_event_loop()
-    task = loop.create_task(connect_and_listen())
+    task = asyncio.create_task(connect_and_listen())
 
     try:
         yield
@@ -167,6 +198,7 @@ async def lifespan(app: FastAPI):  # noqa: ARG001
             with suppress(asyncio.CancelledError):
                 await task
         sup_util.mqtt_connected = False
+        await speech_recognition_tools.close_http_client()
 
 
 app = FastAPI(lifespan=lifespan)
@@ -183,7 +215,7 @@ async def accepts_connection():
     return {
         "status": "ready",
         "active_connections": len(sup_util.active_connections),
-        "max_connections": 50,  # Configurable limit
+        "max_connections": MAX_CONNECTIONS,
     }
 
 
@@ -236,11 +268,7 @@ async def put_text_message(
 
     # Publish to MQTT input topic
     try:
-        await sup_util.mqtt_client.publish(
-            sup_util.config_obj.input_topic,
-            mqtt_request.model_dump_json(),
-            qos=1,
-        )
+        await sup_util.publish_request(mqtt_request)
         logger.info(
             "Published text message from device %s (request_id: %s)",
             request.device_id,
@@ -259,11 +287,12 @@ async def put_text_message(
 
 async def setup_satellite_connection(websocket: WebSocket):
     """Setup MQTT and audio processor for satellite connection."""
-    client_config_raw = await websocket.receive_json()
-    client_conf = client_config.ClientConfig.model_validate(client_config_raw)
+    # Parse the JSON handshake in pydantic-core rather than json.loads + dict validation
+    client_config_raw = await websocket.receive_text()
+    client_conf = client_config.ClientConfig.model_validate_json(client_config_raw)
 
     # Setup MQTT subscription for this client
-    output_queue: asyncio.Queue[messages.Response] = asyncio.Queue()
+    output_queue: asyncio.Queue[messages.Response] = asyncio.Queue(maxsize=sup_util.config_obj.output_queue_max_size)
     output_topic = f"assistant/{client_conf.room}/output"
     client_conf.output_topic = output_topic
     sup_util.mqtt_subscription_to_queue[output_topic] = output_queue
@@ -271,12 +300,22 @@ async def setup_satellite_connection(websocket: WebSocket):
     # Subscribe to client-specific topic (MQTT is guaranteed to be connected)
     await sup_util.mqtt_client.subscribe(output_topic, qos=1)
 
-    sup_util.mqtt_subscription_to_queue[sup_util.config_obj.broadcast_topic] = output_queue
+    # Broadcasts are fanned out to every satellite output queue by listen(), so the
+    # broadcast topic is deliberately not mapped to a single queue here
 
     # AIDEV-NOTE: New ground station protocol - handle satellite communication
-    audio_processor = processing_sound.SatelliteAudioProcessor(
-        websocket=websocket, config_obj=sup_util.config_obj, client_conf=client_conf, logger=logger, sup_util=sup_util
-    )
+    # Processors are pooled across reconnects; a pooled one is rebound to this satellite
+    if sup_util.processor_pool:
+        audio_processor = sup_util.processor_pool.popleft()
+        audio_processor.reset(websocket, client_conf)
+    else:
+        audio_processor = processing_sound.SatelliteAudioProcessor(
+            websocket=websocket,
+            config_obj=sup_util.config_obj,
+            client_conf=client_conf,
+            logger=logger,
+            sup_util=sup_util,
+        )
 
     return client_conf, output_queue, audio_processor
 
@@ -288,7 +327,6 @@ async def handle_satellite_messages(websocket: WebSocket, audio_processor, outpu
         while True:
             try:
                 await process_output_queue(websocket, output_queue, sup_util.config_obj, client_conf)
-                await asyncio.sleep(0.01)  # Small delay to prevent busy waiting
             except Exception as e:
                 logger.error("Error processing MQTT responses: %s", e)
                 break
@@ -296,25 +334,29 @@ async def handle_satellite_messages(websocket: WebSocket, audio_processor, outpu
     # Start MQTT response handler
     mqtt_task = asyncio.create_task(handle_mqtt_responses())
 
+    handle_audio_data = audio_processor.handle_audio_data
+    handle_control_signal = audio_processor.handle_control_signal
+
     try:
         # Main message loop
         while True:
             message = await websocket.receive()
 
+            # Handle audio data from satellite; audio frames dominate, so they are checked first
+            audio_bytes = message.get("bytes")
+            if audio_bytes is not None:
+                await handle_audio_data(audio_bytes)
+                continue
+
             # Handle disconnect message explicitly
-            if message.get("type") == "websocket.disconnect":
+            if message["type"] == "websocket.disconnect":
                 logger.info("Received disconnect message from WebSocket")
                 break
 
-            if "text" in message:
-                text_message = message["text"]
+            text_message = message.get("text")
+            if text_message is not None:
                 # Handle control signals from satellite
-                await audio_processor.handle_control_signal(text_message)
-
-            elif "bytes" in message:
-                # Handle audio data from satellite
-                audio_bytes = message["bytes"]
-                await audio_processor.handle_audio_data(audio_bytes)
+                await handle_control_signal(text_message)
 
     except RuntimeError as e:
         # Handle "Cannot call receive once a disconnect message has been received"
@@ -330,24 +372,37 @@ async def handle_satellite_messages(websocket: WebSocket, audio_processor, outpu
 
 @app.websocket("/satellite")
 async def websocket_endpoint(websocket: WebSocket):
-    connection_id = id(websocket)
-    if connection_id in sup_util.active_connections:
+    if websocket in sup_util.active_connections:
         await websocket.close(code=1001, reason="Connection already exists")
         return
 
-    await websocket.accept()
-
-    # Check if MQTT is connected before allowing WebSocket connection
-    if not sup_util.mqtt_connected:
-        logger.warning("Rejecting WebSocket connection: MQTT not connected")
-        await websocket.close(code=1011, reason="MQTT broker unavailable")
+    if len(sup_util.active_connections) >= MAX_CONNECTIONS:
+        logger.warning("Rejecting WebSocket connection: %d satellites already connected", MAX_CONNECTIONS)
+        # Closing before accept() is sent as an HTTP 403 without a close code; accept first so the satellite
+        # receives 1013 (try again later). The rejected socket never takes a slot.
+        with suppress(Exception):
+            await websocket.accept()
+            await websocket.close(code=1013, reason="Ground station at capacity")
         return
 
-    sup_util.active_connections[connection_id] = websocket
+    # AIDEV-NOTE: Reserve the slot before the first await, so the duplicate and capacity checks above and this
+    # add run as one step on the event loop; concurrent handshakes cannot both pass the checks. The socket is in
+    # active_connections before accept() by design; code that closes sockets from the set must skip ones whose
+    # application_state is not CONNECTED yet
+    sup_util.active_connections.add(websocket)
     output_topic = None
     client_room = None
+    audio_processor = None
 
     try:
+        await websocket.accept()
+
+        # Check if MQTT is connected before allowing WebSocket connection
+        if not sup_util.mqtt_connected:
+            logger.warning("Rejecting WebSocket connection: MQTT not connected")
+            await websocket.close(code=1011, reason="MQTT broker unavailable")
+            return
+
         client_conf, output_queue, audio_processor = await setup_satellite_connection(websocket)
         output_topic = client_conf.output_topic
         client_room = client_conf.room
@@ -367,15 +422,19 @@ async def websocket_endpoint(websocket: WebSocket):
     finally:
         # AIDEV-NOTE: Cleanup connection state to prevent stale references and queue buildup
         # Remove from active connections immediately
-        if connection_id in sup_util.active_connections:
-            del sup_util.active_connections[connection_id]
-            logger.debug("Removed connection %s from active connections", connection_id)
+        sup_util.active_connections.discard(websocket)
+        logger.debug("Removed connection %s from active connections", id(websocket))
 
         # Cleanup MQTT subscription queue mapping for satellite-specific topic
         if output_topic and output_topic in sup_util.mqtt_subscription_to_queue:
             del sup_util.mqtt_subscription_to_queue[output_topic]
             logger.debug("Removed MQTT queue mapping for topic: %s", output_topic)
 
+        # Return the processor to the pool for the next connection, without its audio buffer or socket
+        if audio_processor is not None and len(sup_util.processor_pool) < PROCESSOR_POOL_MAX_SIZE:
+            audio_processor.release()
+            sup_util.processor_pool.append(audio_processor)
+
         logger.info(
             "Satellite cleanup complete: room=%s, active_connections=%d",
             client_room or "unknown",
@@ -389,21 +448,49 @@ async def process_output_queue(
     config_obj: config.Config,
     client_conf: client_config.ClientConfig,
 ):
-    # AIDEV-NOTE: Optimized to process all available messages to reduce queue buildup
-    processed_count = 0
+    # AIDEV-NOTE: Waits on the queue instead of polling, then drains what is already queued up to the cap.
+    # One TTS task per drained response is started up front; each alert is sent before awaiting its task, audio goes
+    # out in queue order, and tasks left over after a disconnect are cancelled.
     max_process_per_cycle = 3  # Limit processing to prevent blocking audio
 
-    try:
-        while processed_count < max_process_per_cycle:
-            response = output_queue.get_nowait()
+    response = await output_queue.get()
+    if output_queue.empty() and config_obj.tts_stream_chunk_size is None:
+        # Common case: a lone response has no synthesis to overlap with, so skip the batch and task setup
+        await send_single_response(websocket, response, config_obj, client_conf)
+        return
+
+    pending = [response]
+    while len(pending) < max_process_per_cycle:
+        try:
+            pending.append(output_queue.get_nowait())
+        except asyncio.QueueEmpty:
+            # No more messages to process
+            break
 
+    if config_obj.tts_stream_chunk_size is not None:
+        await stream_output_responses(websocket, pending, config_obj, client_conf, config_obj.tts_stream_chunk_size)
+        return
+
+    tts_tasks = [
+        asyncio.create_task(
+            speech_recognition_tools.send_text_to_tts_api(response.text, config_obj, sample_rate=client_conf.samplerate)
+        )
+        for response in pending
+    ]
+
+    processed_count = 0
+    try:
+        for response, tts_task in zip(pending, tts_tasks, strict=True):
             # Validate WebSocket is still connected before sending
             try:
-                audio_bytes = await speech_recognition_tools.send_text_to_tts_api(
-                    response.text, config_obj, sample_rate=client_conf.samplerate
-                )
+                # The alert goes out while synthesis is still in flight, so the satellite plays it during TTS
                 if response.alert is not None and response.alert.play_before:
                     await websocket.send_text("alert_default")
+                try:
+                    audio_bytes = await tts_task
+                except Exception as e:
+                    logger.error("TTS request failed: %s", e)
+                    continue
                 if audio_bytes is not None:
                     await websocket.send_bytes(audio_bytes)
                 processed_count += 1
@@ -411,8 +498,62 @@ async def process_output_queue(
                 # Connection closed while processing, stop sending
                 logger.debug("WebSocket disconnected during send: %s", e)
                 break
+    finally:
+        # Drop synthesis that can no longer be delivered
+        for tts_task in tts_tasks:
+            tts_task.cancel()
 
-    except asyncio.QueueEmpty:
-        if processed_count > 0:
-            logger.debug("Processed %d messages from output queue", processed_count)
-        # No more messages to process
+    logger.debug("Processed %d messages from output queue", processed_count)
+
+
+async def send_single_response(
+    websocket: WebSocket,
+    response: messages.Response,
+    config_obj: config.Config,
+    client_conf: client_config.ClientConfig,
+) -> None:
+    """Send one response, synthesizing its audio inline."""
+    try:
+        if response.alert is not None and response.alert.play_before:
+            await websocket.send_text("alert_default")
+        try:
+            audio_bytes = await speech_recognition_tools.send_text_to_tts_api(
+                response.text, config_obj, sample_rate=client_conf.samplerate
+            )
+        except Exception as e:
+            logger.error("TTS request failed: %s", e)
+            return
+        if audio_bytes is not None:
+            await websocket.send_bytes(audio_bytes)
+    except (WebSocketDisconnect, RuntimeError) as e:
+        # Connection closed while processing, stop sending
+        logger.debug("WebSocket disconnected during send: %s", e)
+
+
+async def stream_output_responses(
+    websocket: WebSocket,
+    responses: list[messages.Response],
+    config_obj: config.Config,
+    client_conf: client_config.ClientConfig,
+    chunk_size: int,
+) -> None:
+    """Send responses with TTS audio forwarded chunk by chunk as it is synthesized."""
+    # AIDEV-NOTE: Streaming trades concurrent synthesis for time-to-first-audio; responses are synthesized in order
+    processed_count = 0
+    try:
+        for response in responses:
+            if response.alert is not None and response.alert.play_before:
+                await websocket.send_text("alert_default")
+            async with aclosing(
+                speech_recognition_tools.stream_text_to_tts_api(
+                    response.text, config_obj, sample_rate=client_conf.samplerate, chunk_size=chunk_size
+                )
+            ) as audio_chunks:
+                async for chunk in audio_chunks:
+                    await websocket.send_bytes(chunk)
+            processed_count += 1
+    except (WebSocketDisconnect, RuntimeError) as e:
+        # Connection closed while processing, stop sending
+        logger.debug("WebSocket disconnected during send: %s", e)
+
+    logger.debug("Streamed %d messages from output queue", processed_count)
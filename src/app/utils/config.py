@@ -1,15 +1,22 @@
 import logging
 import socket
+from functools import cached_property
 from pathlib import Path
 
+import httpx
 import yaml
 from private_assistant_commons import SkillConfig as CommonsSkillConfig
 from pydantic import Field, ValidationError
 
 logger = logging.getLogger(__name__)
 
+# libyaml-backed loader when PyYAML was built with it; same safe subset as yaml.safe_load
+_YamlSafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
-class Config(CommonsSkillConfig):
+
+# AIDEV-NOTE: Frozen because the cached_property URLs and headers below are derived once from the fields;
+# assigning a field after first use would leave them stale
+class Config(CommonsSkillConfig, frozen=True):
     """Ground station configuration extending commons SkillConfig.
 
     Inherits from CommonsSkillConfig:
@@ -30,6 +37,8 @@ class Config(CommonsSkillConfig):
     # Speech API configuration
     speech_transcription_api: str = "http://localhost:8000/transcribe"
     speech_transcription_api_token: str | None = None
+    # Upload STT audio as a raw octet-stream body instead of a multipart "file" field; the server must accept it
+    speech_transcription_raw_body: bool = False
     speech_synthesis_api: str = "http://localhost:8080/synthesizeSpeech"
     speech_synthesis_api_token: str | None = None
 
@@ -38,12 +47,41 @@ class Config(CommonsSkillConfig):
 
     # Ground station specific
     max_command_input_seconds: int = 30
+    output_queue_max_size: int = Field(default=64, gt=0)
+    # Forward TTS audio in frames of this many bytes as it is synthesized; None sends one frame per response
+    tts_stream_chunk_size: int | None = Field(default=None, gt=0, multiple_of=2)
     remote_broadcast_topic: str = "assistant/remote_broadcast"
     client_topic_overwrite: str | None = None
     input_topic_overwrite: str | None = None
     output_topic_overwrite: str | None = None
     text_endpoint_auth_token: str = "DEBUG"
 
+    @cached_property
+    def speech_transcription_url(self) -> httpx.URL:
+        """STT endpoint parsed once, so requests do not re-parse the URL string."""
+        return httpx.URL(self.speech_transcription_api)
+
+    @cached_property
+    def speech_synthesis_url(self) -> httpx.URL:
+        """TTS endpoint parsed once, so requests do not re-parse the URL string."""
+        return httpx.URL(self.speech_synthesis_api)
+
+    # AIDEV-NOTE: Headers are built once as httpx.Headers, which httpx copies per request without re-encoding each
+    # field; treat them as read-only, they are shared by every request
+    @cached_property
+    def speech_transcription_headers(self) -> httpx.Headers:
+        """STT request headers, built once."""
+        headers = {"user-token": self.speech_transcription_api_token or ""}
+        if self.speech_transcription_raw_body:
+            # Multipart uploads must leave Content-Type to httpx, which adds the boundary
+            headers["Content-Type"] = "application/octet-stream"
+        return httpx.Headers(headers)
+
+    @cached_property
+    def speech_synthesis_headers(self) -> httpx.Headers:
+        """TTS request headers, built once."""
+        return httpx.Headers({"user-token": self.speech_synthesis_api_token or "", "Content-Type": "application/json"})
+
     @property
     def client_topic(self) -> str:
         """Computed client topic for ground station.
@@ -67,7 +105,7 @@ class Config(CommonsSkillConfig):
 def load_config(config_path: Path) -> Config:
     try:
         with config_path.open("r") as file:
-            config_data = yaml.safe_load(file)
+            config_data = yaml.load(file, Loader=_YamlSafeLoader)
         return Config.model_validate(config_data)
     except FileNotFoundError as err:
         logger.error("Config file not found: %s", config_path)
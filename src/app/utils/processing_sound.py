@@ -1,8 +1,11 @@
+import functools
 import logging
 import math
 import uuid
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass
 from enum import Enum
+from typing import ClassVar
 
 import numpy as np
 from fastapi import WebSocket
@@ -24,15 +27,47 @@ class ProcessingState(Enum):
     PROCESSING_STT = "processing_stt"
 
 
-@dataclass
+@dataclass(slots=True)
 class AudioConfig:
     max_frames: int
     max_buffer_size: int = 1024 * 1024  # 1MB max buffer size
 
 
+@functools.lru_cache(maxsize=8)
+def _error_beep_bytes(sample_rate: int, duration: float, frequency: int) -> bytes:
+    """Synthesize the error beep as 16-bit PCM; cached since it only depends on its arguments."""
+    samples = int(sample_rate * duration)
+    phase_step = np.float32(2 * math.pi * frequency / sample_rate)
+    beep = np.sin(phase_step * np.arange(samples, dtype=np.float32))
+
+    # Raised-cosine (half Hann) fade in/out to avoid clicks
+    fade_samples = min(int(sample_rate * 0.05), samples)  # 50ms fade
+    if fade_samples > 0:
+        fade_in = 0.5 - 0.5 * np.cos(np.linspace(0, math.pi, fade_samples, dtype=np.float32))
+        beep[:fade_samples] *= fade_in
+        beep[-fade_samples:] *= fade_in[::-1]
+
+    # Convert to 16-bit PCM, rounding to nearest instead of truncating toward zero
+    beep *= 32767
+    np.rint(beep, out=beep)
+    return beep.astype(np.int16).tobytes()
+
+
 class SatelliteAudioProcessor:
     """Processes audio from satellites in the new ground station architecture."""
 
+    __slots__ = (
+        "_audio_data",
+        "_buffer_size_bytes",
+        "_client_conf",
+        "_websocket",
+        "audio_config",
+        "config_obj",
+        "logger",
+        "state",
+        "sup_util",
+    )
+
     def __init__(
         self,
         websocket: WebSocket,
@@ -41,9 +76,9 @@ class SatelliteAudioProcessor:
         logger: logging.Logger,
         sup_util: support_utils.SupportUtils,
     ) -> None:
-        self.websocket = websocket
+        self._websocket: WebSocket | None = websocket
         self.config_obj = config_obj
-        self.client_conf = client_conf
+        self._client_conf: client_config.ClientConfig | None = client_conf
         self.logger = logger
         self.sup_util = sup_util
 
@@ -53,21 +88,60 @@ class SatelliteAudioProcessor:
 
         # Audio processing state
         self.state = ProcessingState.IDLE
-        self.audio_buffer: list[bytes] = []
+        # AIDEV-NOTE: Audio is written into one reusable buffer, sized on the first command, so a command costs
+        # no per-chunk allocations and no final join; _buffer_size_bytes is the write cursor. Trade-off: the buffer
+        # is always max_buffer_size (1 MiB), even for a short utterance, and clear()/reset() keep it for the life of
+        # the connection. release() frees it when the processor goes back to the pool.
+        self._audio_data = bytearray()
         self._buffer_size_bytes: int = 0
 
+    @property
+    def websocket(self) -> WebSocket:
+        if self._websocket is None:
+            raise ValueError("Processor is not bound to a WebSocket")
+        return self._websocket
+
+    @property
+    def client_conf(self) -> client_config.ClientConfig:
+        if self._client_conf is None:
+            raise ValueError("Processor is not bound to a client config")
+        return self._client_conf
+
+    @property
+    def audio_buffer(self) -> memoryview:
+        """Audio collected for the current command, as a view into the reusable buffer."""
+        return memoryview(self._audio_data)[: self._buffer_size_bytes]
+
+    def reset(self, websocket: WebSocket, client_conf: client_config.ClientConfig) -> None:
+        """Rebind a pooled processor to a new satellite connection."""
+        self._websocket = websocket
+        self._client_conf = client_conf
+        self.audio_config = AudioConfig(
+            max_frames=self.config_obj.max_command_input_seconds * client_conf.samplerate,
+        )
+        self.clear()
+
+    def clear(self) -> None:
+        """Drop any collected audio and return to idle."""
+        self.state = ProcessingState.IDLE
+        self._buffer_size_bytes = 0
+
+    def release(self) -> None:
+        """Free the audio buffer and drop the connection references before the processor is pooled."""
+        self.clear()
+        self._audio_data = bytearray()
+        self._websocket = None
+        self._client_conf = None
+
     async def handle_control_signal(self, signal: str) -> None:
         """Handle control signals from satellite."""
         self.logger.debug("Received control signal: %s", signal)
 
-        if signal == "START_COMMAND":
-            await self._start_audio_collection()
-        elif signal == "END_COMMAND":
-            await self._end_audio_collection()
-        elif signal == "CANCEL_COMMAND":
-            await self._cancel_processing()
-        else:
+        handler = self._control_handlers.get(signal)
+        if handler is None:
             self.logger.warning("Unknown control signal: %s", signal)
+            return
+        await handler(self)
 
     async def handle_audio_data(self, audio_bytes: bytes) -> None:
         """Handle audio data from satellite."""
@@ -75,20 +149,26 @@ class SatelliteAudioProcessor:
             self.logger.warning("Received audio data while not collecting audio, ignoring")
             return
 
+        chunk_size = len(audio_bytes)
+
         # Check buffer size limits
-        if self._buffer_size_bytes + len(audio_bytes) > self.audio_config.max_buffer_size:
+        if self._buffer_size_bytes + chunk_size > self.audio_config.max_buffer_size:
             self.logger.warning("Audio buffer size limit reached, processing current audio")
             await self._process_collected_audio()
             return
 
         # Add to buffer
-        self.audio_buffer.append(audio_bytes)
-        self._buffer_size_bytes += len(audio_bytes)
+        write_pos = self._buffer_size_bytes
+        self._audio_data[write_pos : write_pos + chunk_size] = audio_bytes
+        self._buffer_size_bytes = write_pos + chunk_size
 
-        self.logger.debug("Collected audio chunk (buffer size: %d bytes)", self._buffer_size_bytes)
+        # Fires for every chunk; skip the logging call entirely unless debug output is on
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Collected audio chunk (buffer size: %d bytes)", self._buffer_size_bytes)
 
         # Check if we've exceeded the maximum audio duration
-        total_samples = sum(len(chunk) // 2 for chunk in self.audio_buffer)  # 16-bit audio = 2 bytes per sample
+        # The running byte count gives the sample count directly: 16-bit audio = 2 bytes per sample
+        total_samples = self._buffer_size_bytes // 2
         if total_samples > self.audio_config.max_frames:
             self.logger.info("Maximum audio duration reached, processing current audio")
             await self._process_collected_audio()
@@ -100,7 +180,8 @@ class SatelliteAudioProcessor:
             return
 
         self.state = ProcessingState.COLLECTING_AUDIO
-        self.audio_buffer.clear()
+        if len(self._audio_data) < self.audio_config.max_buffer_size:
+            self._audio_data = bytearray(self.audio_config.max_buffer_size)
         self._buffer_size_bytes = 0
         self.logger.info("Started collecting audio from satellite")
 
@@ -116,12 +197,11 @@ class SatelliteAudioProcessor:
         """Cancel current audio processing."""
         self.logger.info("Cancelling audio processing")
         self.state = ProcessingState.IDLE
-        self.audio_buffer.clear()
         self._buffer_size_bytes = 0
 
     async def _process_collected_audio(self) -> None:
         """Process the collected audio buffer."""
-        if not self.audio_buffer:
+        if not self._buffer_size_bytes:
             self.logger.warning("No audio data to process")
             self.state = ProcessingState.IDLE
             return
@@ -129,11 +209,10 @@ class SatelliteAudioProcessor:
         self.state = ProcessingState.PROCESSING_STT
 
         try:
-            # Concatenate all audio chunks
-            full_audio_bytes = b"".join(self.audio_buffer)
-            audio_array = np.frombuffer(full_audio_bytes, dtype=np.int16)
+            # Zero-copy int16 view of the collected audio
+            audio_array = np.frombuffer(self.audio_buffer, dtype=np.int16)
 
-            self.logger.info("Processing %d bytes of audio (%d samples)", len(full_audio_bytes), len(audio_array))
+            self.logger.info("Processing %d bytes of audio (%d samples)", self._buffer_size_bytes, len(audio_array))
 
             # Convert to float32 for STT API
             audio_float = srt.int2float(audio_array)
@@ -156,11 +235,7 @@ class SatelliteAudioProcessor:
                 output_topic=self.client_conf.output_topic,
             )
 
-            await self.sup_util.mqtt_client.publish(
-                self.config_obj.input_topic,
-                request.model_dump_json(),
-                qos=1,
-            )
+            await self.sup_util.publish_request(request)
             self.logger.info("Published STT result to MQTT")
 
         except Exception as e:
@@ -169,28 +244,18 @@ class SatelliteAudioProcessor:
         finally:
             # Reset state
             self.state = ProcessingState.IDLE
-            self.audio_buffer.clear()
             self._buffer_size_bytes = 0
 
+    # Signal -> handler, resolved with one dict lookup; handlers are the plain functions, called with the instance
+    _control_handlers: ClassVar[dict[str, Callable[["SatelliteAudioProcessor"], Awaitable[None]]]] = {
+        "START_COMMAND": _start_audio_collection,
+        "END_COMMAND": _end_audio_collection,
+        "CANCEL_COMMAND": _cancel_processing,
+    }
+
     def _generate_error_beep(self, duration: float = 0.5, frequency: int = 800) -> bytes:
         """Generate error beep audio data."""
-        sample_rate = self.client_conf.samplerate
-        samples = int(sample_rate * duration)
-        t = np.linspace(0, duration, samples, False)
-
-        # Generate beep with fade in/out to avoid clicks
-        beep = np.sin(2 * math.pi * frequency * t)
-        fade_samples = int(sample_rate * 0.05)  # 50ms fade
-
-        if fade_samples > 0:
-            fade_in = np.linspace(0, 1, fade_samples)
-            fade_out = np.linspace(1, 0, fade_samples)
-            beep[:fade_samples] *= fade_in
-            beep[-fade_samples:] *= fade_out
-
-        # Convert to 16-bit PCM
-        beep_int16 = (beep * 32767).astype(np.int16)
-        return bytes(beep_int16.tobytes())
+        return _error_beep_bytes(self.client_conf.samplerate, duration, frequency)
 
     async def _send_error_feedback(self) -> None:
         """Send error feedback to satellite."""
@@ -1,47 +1,77 @@
 import logging
+from collections.abc import AsyncGenerator, Iterator
+from contextlib import contextmanager
+from typing import Any, Final
 
 import httpx
 import numpy as np
 import numpy.typing as np_typing
+import pydantic_core
 from pydantic import BaseModel, ValidationError
 
 from app.utils import config
 
 logger = logging.getLogger(__name__)
 
+# AIDEV-NOTE: One pooled client for all STT/TTS calls keeps connections to the speech APIs alive between
+# utterances; it is created lazily inside the running loop and closed by the app lifespan. The senders take an
+# optional client to override it.
+_http_client: httpx.AsyncClient | None = None
+
 
 class STTResponse(BaseModel):
     text: str
     message: str
 
 
+_INV_INT16_MAX: Final = np.float32(1.0 / 32768.0)
+
+
 def int2float(sound: np_typing.NDArray[np.int16]) -> np_typing.NDArray[np.float32]:
-    abs_max = np.abs(sound).max()
-    sound_32: np_typing.NDArray[np.float32] = sound.astype(np.float32)
-    if abs_max > 0:
-        sound_32 *= 1 / 32768
+    # Cast and scale in a single float32 ufunc pass; silence scales to zeros, so no peak check is needed
+    sound_32: np_typing.NDArray[np.float32] = np.multiply(sound, _INV_INT16_MAX, dtype=np.float32)
     return sound_32.squeeze()
 
 
+def get_http_client() -> httpx.AsyncClient:
+    """Return the shared HTTP client for the speech APIs, creating it on first use."""
+    global _http_client  # noqa: PLW0603
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(limits=httpx.Limits(max_connections=32, max_keepalive_connections=32))
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared HTTP client and its pooled connections."""
+    global _http_client  # noqa: PLW0603
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
 async def send_audio_to_stt_api(
     audio_data: np_typing.NDArray[np.float32],
     config_obj: config.Config,
     timeout: float = 10.0,
+    client: httpx.AsyncClient | None = None,
 ) -> STTResponse | None:
     """Send audio to STT API and receive transcription."""
-    files = {"file": ("audio.raw", audio_data.tobytes())}
-    headers = {"user-token": config_obj.speech_transcription_api_token or ""}
+    body: dict[str, Any]
+    if config_obj.speech_transcription_raw_body:
+        body = {"content": audio_data.tobytes()}
+    else:
+        body = {"files": {"file": ("audio.raw", audio_data.tobytes())}}
 
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                config_obj.speech_transcription_api,
-                files=files,
-                headers=headers,
-                timeout=timeout,
-            )
-            response.raise_for_status()
-            return STTResponse.model_validate(response.json())
+        response = await (client or get_http_client()).post(
+            config_obj.speech_transcription_url,
+            **body,
+            headers=config_obj.speech_transcription_headers,
+            timeout=timeout,
+        )
+        response.raise_for_status()
+        # Validate straight from the body bytes; malformed JSON also surfaces as a ValidationError
+        return STTResponse.model_validate_json(response.content)
 
     except httpx.TimeoutException:
         logger.error("Request timed out after %.1f seconds", timeout)
@@ -55,37 +85,24 @@ async def send_audio_to_stt_api(
     return None
 
 
-async def send_text_to_tts_api(
-    text: str,
-    config_obj: config.Config,
-    sample_rate: int = 16000,
-    timeout: float = 10.0,
-) -> bytes | None:
-    """Send text to TTS API and receive audio data."""
-    headers = {
-        "user-token": config_obj.speech_synthesis_api_token or "",
-        "Content-Type": "application/json",
-    }
+MIN_AUDIO_BYTES = 2
 
-    payload = {"text": text, "sample_rate": sample_rate}
 
-    try:
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                url=config_obj.speech_synthesis_api,
-                json=payload,
-                headers=headers,
-                timeout=timeout,
-            )
-            response.raise_for_status()
-
-            min_audio_bytes = 2
-            if len(response.content) < min_audio_bytes:
-                logger.error("Insufficient audio data: %d bytes", len(response.content))
-                return None
+def _tts_request(text: str, config_obj: config.Config, sample_rate: int) -> dict[str, Any]:
+    """Build the request arguments shared by the buffered and streaming TTS calls."""
+    return {
+        "url": config_obj.speech_synthesis_url,
+        # Serialized by pydantic-core to bytes; the synthesis headers mark it as JSON
+        "content": pydantic_core.to_json({"text": text, "sample_rate": sample_rate}),
+        "headers": config_obj.speech_synthesis_headers,
+    }
 
-            return response.content
 
+@contextmanager
+def _log_tts_errors(timeout: float) -> Iterator[None]:
+    """Log and swallow the errors a TTS request can raise."""
+    try:
+        yield
     except httpx.TimeoutException:
         logger.error("Request timed out after %.1f seconds", timeout)
     except httpx.HTTPStatusError as e:
@@ -95,4 +112,55 @@ async def send_text_to_tts_api(
     except ValueError as e:
         logger.error("Audio conversion error: %s", e)
 
+
+async def send_text_to_tts_api(
+    text: str,
+    config_obj: config.Config,
+    sample_rate: int = 16000,
+    timeout: float = 10.0,
+    client: httpx.AsyncClient | None = None,
+) -> bytes | None:
+    """Send text to TTS API and receive audio data."""
+    with _log_tts_errors(timeout):
+        response = await (client or get_http_client()).post(
+            **_tts_request(text, config_obj, sample_rate), timeout=timeout
+        )
+        response.raise_for_status()
+
+        if len(response.content) < MIN_AUDIO_BYTES:
+            logger.error("Insufficient audio data: %d bytes", len(response.content))
+            return None
+
+        return response.content
+
     return None
+
+
+async def stream_text_to_tts_api(  # noqa: PLR0913
+    text: str,
+    config_obj: config.Config,
+    sample_rate: int = 16000,
+    chunk_size: int = 4096,
+    timeout: float = 10.0,
+    client: httpx.AsyncClient | None = None,
+) -> AsyncGenerator[bytes, None]:
+    """Send text to TTS API and yield audio data in chunks as it arrives."""
+    with _log_tts_errors(timeout):
+        async with (client or get_http_client()).stream(
+            "POST", **_tts_request(text, config_obj, sample_rate), timeout=timeout
+        ) as response:
+            if response.is_error:
+                # Error bodies are small; read them so they can be logged
+                await response.aread()
+            response.raise_for_status()
+
+            received = 0
+            async for chunk in response.aiter_bytes(chunk_size):
+                received += len(chunk)
+                if received < MIN_AUDIO_BYTES:
+                    # Only the last chunk can be shorter than chunk_size, so the whole body is too short
+                    break
+                yield chunk
+
+            if received < MIN_AUDIO_BYTES:
+                logger.error("Insufficient audio data: %d bytes", received)
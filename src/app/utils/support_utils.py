@@ -1,27 +1,46 @@
 from __future__ import annotations
 
 import logging
+from collections import deque
 from typing import TYPE_CHECKING
 
+from private_assistant_commons import messages
+from pydantic import TypeAdapter
+
 if TYPE_CHECKING:
     import asyncio
 
     import aiomqtt as mqtt
     from fastapi import WebSocket
-    from private_assistant_commons import MqttConfig, messages
+    from private_assistant_commons import MqttConfig
 
     from app.utils import config
+    from app.utils.processing_sound import SatelliteAudioProcessor
 
 logger = logging.getLogger(__name__)
 
+# Serializes straight to bytes, which aiomqtt publishes without a further str encode
+_client_request_adapter: TypeAdapter[messages.ClientRequest] = TypeAdapter(messages.ClientRequest)
+
 
 class SupportUtils:
+    __slots__ = (
+        "_config_obj",
+        "_mqtt_client",
+        "_mqtt_config",
+        "active_connections",
+        "mqtt_connected",
+        "mqtt_subscription_to_queue",
+        "processor_pool",
+    )
+
     def __init__(self) -> None:
         self._config_obj: config.Config | None = None
         self._mqtt_config: MqttConfig | None = None
         self._mqtt_client: mqtt.Client | None = None
         self.mqtt_subscription_to_queue: dict[str, asyncio.Queue[messages.Response]] = {}
-        self.active_connections: dict[int, WebSocket] = {}
+        self.active_connections: set[WebSocket] = set()
+        self.processor_pool: deque[SatelliteAudioProcessor] = deque()
         self.mqtt_connected: bool = False
 
     @property
@@ -53,3 +72,11 @@ class SupportUtils:
     @mqtt_client.setter
     def mqtt_client(self, value: mqtt.Client) -> None:
         self._mqtt_client = value
+
+    async def publish_request(self, request: messages.ClientRequest) -> None:
+        """Publish a client request to the ground station input topic."""
+        await self.mqtt_client.publish(
+            self.config_obj.input_topic,
+            _client_request_adapter.dump_json(request),
+            qos=1,
+        )
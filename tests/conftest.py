@@ -3,14 +3,33 @@
 import tempfile
 from pathlib import Path
 
+import httpx
 import numpy as np
 import pytest
+import uvloop
 import yaml
 from private_assistant_commons import MqttConfig
 
+from app.main import app
 from app.utils.config import Config
 
 
+@pytest.fixture(scope="session")
+def event_loop_policy():
+    """Run async tests on uvloop, the loop the app is served with (installed by fastapi[standard])."""
+    return uvloop.EventLoopPolicy()
+
+
+@pytest.fixture
+async def client():
+    """Create an HTTP client that calls the app in-process on the test's event loop.
+
+    ASGITransport does not run the app lifespan, so no MQTT connection is attempted.
+    """
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as async_client:
+        yield async_client
+
+
 @pytest.fixture
 def temp_config_file():
     """Create a temporary configuration file for testing."""
@@ -60,8 +79,9 @@ def sample_audio_data():
     duration = 1.0
     frequency = 440.0  # A4 note
 
-    t = np.linspace(0, duration, int(sample_rate * duration), False)
-    return np.sin(2 * np.pi * frequency * t).astype(np.float32)
+    # Computed in float32 throughout, matching the dtype the tests consume
+    t = np.linspace(0, duration, int(sample_rate * duration), endpoint=False, dtype=np.float32)
+    return np.sin(np.float32(2 * np.pi * frequency) * t)
 
 
 @pytest.fixture
@@ -0,0 +1,30 @@
+"""Lightweight test doubles for paths where AsyncMock call bookkeeping is not needed."""
+
+
+class FakeWebSocket:
+    """WebSocket stand-in that records outgoing frames in send order.
+
+    Attributes:
+        sent: ``(method, data)`` pairs for every send attempt, including one that raised
+        send_error: Exception raised by every send after it is recorded, e.g. ``WebSocketDisconnect()``
+    """
+
+    def __init__(self, send_error: Exception | None = None) -> None:
+        self.sent: list[tuple[str, str | bytes]] = []
+        self.send_error = send_error
+
+    @property
+    def bytes_sent(self) -> list[bytes]:
+        """Binary frames in send order."""
+        return [data for method, data in self.sent if method == "send_bytes" and isinstance(data, bytes)]
+
+    async def send_text(self, data: str) -> None:
+        self._record("send_text", data)
+
+    async def send_bytes(self, data: bytes) -> None:
+        self._record("send_bytes", data)
+
+    def _record(self, method: str, data: str | bytes) -> None:
+        self.sent.append((method, data))
+        if self.send_error is not None:
+            raise self.send_error
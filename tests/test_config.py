@@ -3,9 +3,11 @@
 import tempfile
 from pathlib import Path
 
+import httpx
 import pytest
 import yaml
 from private_assistant_commons import MqttConfig
+from pydantic import ValidationError
 
 from app.utils.config import Config, load_config
 
@@ -72,6 +74,41 @@ class TestConfig:
         with pytest.raises(FileNotFoundError):
             load_config(Path("nonexistent.yaml"))
 
+    def test_speech_api_urls_are_parsed_once(self):
+        """Test that the speech API endpoints are exposed as cached httpx URLs."""
+        config = Config(
+            speech_transcription_api="http://stt:8000/transcribe", speech_synthesis_api="http://tts:8080/synthesize"
+        )
+
+        assert config.speech_transcription_url == httpx.URL("http://stt:8000/transcribe")
+        assert config.speech_synthesis_url == httpx.URL("http://tts:8080/synthesize")
+        assert config.speech_transcription_url is config.speech_transcription_url
+        assert config.speech_synthesis_url is config.speech_synthesis_url
+
+    def test_speech_api_headers(self):
+        """Test that the speech API headers carry the tokens and are built once."""
+        config = Config(speech_transcription_api_token="stt-token", speech_synthesis_api_token=None)
+
+        assert isinstance(config.speech_transcription_headers, httpx.Headers)
+        assert config.speech_transcription_headers == {"user-token": "stt-token"}
+        assert config.speech_synthesis_headers == {"user-token": "", "Content-Type": "application/json"}
+        assert config.speech_synthesis_headers is config.speech_synthesis_headers
+
+    def test_config_is_frozen(self):
+        """Test that fields cannot be reassigned after the derived URLs and headers are cached."""
+        config = Config(speech_transcription_api_token="stt-token")
+        assert config.speech_transcription_headers["user-token"] == "stt-token"
+
+        with pytest.raises(ValidationError):
+            config.speech_transcription_api_token = "other"
+
+    def test_speech_transcription_raw_body_headers(self):
+        """Test that raw-body STT uploads declare an octet-stream Content-Type."""
+        config = Config(speech_transcription_raw_body=True)
+
+        assert config.speech_transcription_headers["Content-Type"] == "application/octet-stream"
+        assert "Content-Type" not in Config().speech_transcription_headers
+
     def test_config_with_auth_tokens(self):
         """Test configuration with authentication tokens."""
         config = Config(speech_transcription_api_token="stt-token-123", speech_synthesis_api_token="tts-token-456")
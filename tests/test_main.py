@@ -1,48 +1,34 @@
 """Tests for main application module."""
 
 import asyncio
+import json
 import logging
-from contextlib import suppress
+from collections import deque
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import aiomqtt
 import pytest
+from fastapi import WebSocketDisconnect
 from fastapi.testclient import TestClient
-
-from app.main import app, decode_message_payload, listen, setup_satellite_connection, sup_util, websocket_endpoint
-
-
-class TestUtilityFunctions:
-    """Test utility functions."""
-
-    def test_decode_message_payload_bytes(self):
-        """Test decoding bytes payload."""
-        payload = b"test message"
-        result = decode_message_payload(payload)
-        assert result == "test message"
-
-    def test_decode_message_payload_bytearray(self):
-        """Test decoding bytearray payload."""
-        payload = bytearray(b"test message")
-        result = decode_message_payload(payload)
-        assert result == "test message"
-
-    def test_decode_message_payload_string(self):
-        """Test decoding string payload."""
-        payload = "test message"
-        result = decode_message_payload(payload)
-        assert result == "test message"
-
-    def test_decode_message_payload_invalid_type(self):
-        """Test decoding invalid payload type."""
-        payload = 12345
-        result = decode_message_payload(payload)
-        assert result is None
-
-    def test_decode_message_payload_unicode(self):
-        """Test decoding unicode payload."""
-        payload = "test message with unicode: 你好".encode()
-        result = decode_message_payload(payload)
-        assert result == "test message with unicode: 你好"
+from fastapi.websockets import WebSocketState
+from private_assistant_commons import messages
+
+from app.main import (
+    MAX_CONNECTIONS,
+    PROCESSOR_POOL_MAX_SIZE,
+    app,
+    handle_satellite_messages,
+    lifespan,
+    listen,
+    process_output_queue,
+    setup_satellite_connection,
+    sup_util,
+    websocket_endpoint,
+)
+from app.utils.client_config import ClientConfig
+from app.utils.config import Config
+from app.utils.processing_sound import SatelliteAudioProcessor
+from tests.fakes import FakeWebSocket
 
 
 class TestListenFunction:
@@ -89,9 +75,8 @@ class TestListenFunction:
 
         mock_mqtt_client.messages = mock_messages()
 
-        # Run listen (will process one message then exit)
-        with suppress(TimeoutError):
-            await asyncio.wait_for(listen(mock_mqtt_client, mock_sup_util), timeout=0.1)
+        # listen returns once the message iterator is exhausted
+        await listen(mock_mqtt_client, mock_sup_util)
 
         # Verify message was forwarded to both satellites
         assert queue1.qsize() == 1
@@ -116,8 +101,8 @@ class TestListenFunction:
 
         mock_mqtt_client.messages = mock_messages()
 
-        with caplog.at_level(logging.DEBUG), suppress(TimeoutError):
-            await asyncio.wait_for(listen(mock_mqtt_client, mock_sup_util), timeout=0.1)
+        with caplog.at_level(logging.DEBUG):
+            await listen(mock_mqtt_client, mock_sup_util)
 
         # Verify debug message logged (not warning)
         assert "no satellites connected" in caplog.text
@@ -138,8 +123,8 @@ class TestListenFunction:
 
         mock_mqtt_client.messages = mock_messages()
 
-        with caplog.at_level(logging.ERROR), suppress(TimeoutError):
-            await asyncio.wait_for(listen(mock_mqtt_client, mock_sup_util), timeout=0.1)
+        with caplog.at_level(logging.ERROR):
+            await listen(mock_mqtt_client, mock_sup_util)
 
         # Verify error logged and message not forwarded
         assert "failed validation" in caplog.text.lower()
@@ -160,8 +145,7 @@ class TestListenFunction:
 
         mock_mqtt_client.messages = mock_messages()
 
-        with suppress(TimeoutError):
-            await asyncio.wait_for(listen(mock_mqtt_client, mock_sup_util), timeout=0.1)
+        await listen(mock_mqtt_client, mock_sup_util)
 
         # Verify message went to correct queue
         assert room_queue.qsize() == 1
@@ -182,64 +166,220 @@ class TestListenFunction:
 
         mock_mqtt_client.messages = mock_messages()
 
-        with caplog.at_level(logging.WARNING), suppress(TimeoutError):
-            await asyncio.wait_for(listen(mock_mqtt_client, mock_sup_util), timeout=0.1)
+        with caplog.at_level(logging.WARNING):
+            await listen(mock_mqtt_client, mock_sup_util)
 
         # Verify warning logged for unknown topic
         assert "seems to have no queue" in caplog.text
         assert caplog.records[0].levelname == "WARNING"
 
+    async def test_listen_full_queue_drops_oldest(self, mock_mqtt_client, mock_sup_util, mock_message, caplog):
+        """Test a full satellite queue drops its oldest response for the new one."""
+        room_queue = asyncio.Queue(maxsize=1)
+        room_queue.put_nowait(messages.Response(text="stale"))
+        mock_sup_util.mqtt_subscription_to_queue = {"assistant/room1/output": room_queue}
 
-class TestHTTPEndpoints:
-    """Test HTTP endpoints."""
+        mock_message.topic.value = "assistant/room1/output"
+        mock_message.payload = b'{"text": "fresh", "alert": null}'
+
+        async def mock_messages():
+            yield mock_message
+
+        mock_mqtt_client.messages = mock_messages()
+
+        with caplog.at_level(logging.WARNING):
+            await listen(mock_mqtt_client, mock_sup_util)
+
+        assert room_queue.qsize() == 1
+        assert room_queue.get_nowait().text == "fresh"
+        assert "dropped oldest response" in caplog.text
+
+    async def test_listen_unexpected_payload_type(self, mock_mqtt_client, mock_sup_util, mock_message, caplog):
+        """Test message with non-bytes payload is discarded with a warning."""
+        room_queue = asyncio.Queue()
+        mock_sup_util.mqtt_subscription_to_queue = {"assistant/room1/output": room_queue}
+
+        mock_message.topic.value = "assistant/room1/output"
+        mock_message.payload = 12345
+
+        async def mock_messages():
+            yield mock_message
+
+        mock_mqtt_client.messages = mock_messages()
+
+        with caplog.at_level(logging.WARNING):
+            await listen(mock_mqtt_client, mock_sup_util)
+
+        assert "Unexpected payload type" in caplog.text
+        assert room_queue.qsize() == 0
+
+
+class TestLifespan:
+    """Test the MQTT connection loop started by the lifespan handler."""
 
     @pytest.fixture
-    def client(self):
-        """Create test client."""
-        return TestClient(app)
+    def mock_mqtt(self, monkeypatch):
+        """Patch config loading and the MQTT client used by the lifespan handler."""
+        # The lifespan assigns these on the module-global sup_util; monkeypatch restores them after each test
+        for attribute in ("_config_obj", "_mqtt_config", "_mqtt_client", "mqtt_connected"):
+            monkeypatch.setattr(sup_util, attribute, getattr(sup_util, attribute))
+        monkeypatch.setattr(sup_util, "mqtt_subscription_to_queue", {})
+        monkeypatch.setattr(sup_util, "active_connections", set())
+
+        mqtt_client = MagicMock()
+        mqtt_client.subscribe = AsyncMock()
+        with (
+            patch("app.main.config.load_config", return_value=Config()),
+            patch("app.main.MqttConfig"),
+            patch("app.main.aiomqtt.Client") as mock_client_class,
+        ):
+            mock_client_class.return_value.__aenter__.return_value = mqtt_client
+            yield mock_client_class, mqtt_client
+
+    async def test_subscribes_all_topics_at_once(self, mock_mqtt):
+        """Test that broadcast and registered satellite topics share one subscribe call."""
+        _, mqtt_client = mock_mqtt
+        sup_util.mqtt_subscription_to_queue["assistant/kitchen/output"] = asyncio.Queue()
+        sup_util.mqtt_subscription_to_queue["assistant/office/output"] = asyncio.Queue()
+        listening = asyncio.Event()
+
+        async def fake_listen(*_args, **_kwargs):
+            listening.set()
+            await asyncio.Event().wait()
+
+        with patch("app.main.listen", side_effect=fake_listen):
+            async with lifespan(app):
+                await listening.wait()
+
+        mqtt_client.subscribe.assert_awaited_once_with(
+            [("assistant/broadcast", 1), ("assistant/kitchen/output", 1), ("assistant/office/output", 1)]
+        )
+
+    async def test_shutdown_closes_http_client(self, mock_mqtt):  # noqa: ARG002
+        """Test that the shared speech API client is closed on shutdown."""
+        with (
+            patch("app.main.listen", side_effect=lambda *_args, **_kwargs: asyncio.Event().wait()),
+            patch("app.main.speech_recognition_tools.close_http_client") as mock_close,
+        ):
+            async with lifespan(app):
+                pass
+
+        mock_close.assert_awaited_once()
+
+    async def test_mqtt_loss_closes_websockets_concurrently(self, mock_mqtt, caplog):
+        """Test that every accepted satellite is closed on MQTT loss, even when one close fails."""
+        mock_client_class, _ = mock_mqtt
+        mock_client_class.return_value.__aenter__.side_effect = aiomqtt.MqttError("connection refused")
+        all_closing = asyncio.Event()
+        closing = 0
+
+        async def slow_close(**_kwargs):
+            nonlocal closing
+            closing += 1
+            if closing == 2:  # noqa: PLR2004
+                all_closing.set()
+            # Both closes must be in flight at once for this to return
+            await all_closing.wait()
+
+        healthy, broken, handshaking = AsyncMock(), AsyncMock(), AsyncMock()
+        healthy.application_state = broken.application_state = WebSocketState.CONNECTED
+        handshaking.application_state = WebSocketState.CONNECTING
+        healthy.close.side_effect = slow_close
+
+        async def failing_close(**kwargs):
+            await slow_close(**kwargs)
+            raise RuntimeError("already closed")
+
+        broken.close.side_effect = failing_close
+        sup_util.active_connections.update({healthy, broken, handshaking})
+        slept = asyncio.Event()
+
+        async def fake_sleep(_delay):
+            slept.set()
+            raise asyncio.CancelledError
+
+        with patch("app.main.asyncio.sleep", side_effect=fake_sleep), caplog.at_level(logging.INFO):
+            async with lifespan(app):
+                await slept.wait()
+
+        healthy.close.assert_awaited_once_with(code=1011, reason="MQTT connection lost")
+        broken.close.assert_awaited_once_with(code=1011, reason="MQTT connection lost")
+        handshaking.close.assert_not_called()
+        assert "Error closing WebSocket: already closed" in caplog.text
+        assert "Closed WebSocket connection due to MQTT disconnect" in caplog.text
+
+    @pytest.mark.parametrize("factor", [0.5, 0.75, 1.0])
+    async def test_reconnect_delay_is_jittered(self, mock_mqtt, factor):
+        """Test that the reconnect sleep stays within 50-100% of the backoff delay."""
+        mock_client_class, _ = mock_mqtt
+        mock_client_class.return_value.__aenter__.side_effect = aiomqtt.MqttError("connection refused")
+        slept = asyncio.Event()
+        sleep_calls = []
+
+        async def fake_sleep(delay):
+            sleep_calls.append(delay)
+            slept.set()
+            # Stop the reconnect loop after the first backoff
+            raise asyncio.CancelledError
+
+        with (
+            patch("app.main.random.uniform", return_value=factor) as mock_uniform,
+            patch("app.main.asyncio.sleep", side_effect=fake_sleep),
+        ):
+            async with lifespan(app):
+                await slept.wait()
+
+        mock_uniform.assert_called_once_with(0.5, 1.0)
+        reconnect_delay = 5
+        assert sleep_calls == [reconnect_delay * factor]
+        assert 0.5 * reconnect_delay <= sleep_calls[0] <= reconnect_delay
 
-    def test_health_endpoint(self, client):
+
+class TestHTTPEndpoints:
+    """Test HTTP endpoints."""
+
+    async def test_health_endpoint(self, client):
         """Test health endpoint."""
-        response = client.get("/health")
+        response = await client.get("/health")
         assert response.status_code == 200  # noqa: PLR2004
         assert response.json() == {"status": "healthy"}
 
-    @patch("app.main.sup_util.active_connections", {})
-    def test_accepts_connections_empty(self, client):
+    @patch("app.main.sup_util.active_connections", set())
+    async def test_accepts_connections_empty(self, client):
         """Test accepts connections endpoint with no active connections."""
-        response = client.get("/acceptsConnections")
+        response = await client.get("/acceptsConnections")
         assert response.status_code == 200  # noqa: PLR2004
         data = response.json()
         assert data["status"] == "ready"
         assert data["active_connections"] == 0
-        assert data["max_connections"] == 50  # noqa: PLR2004
+        assert data["max_connections"] == MAX_CONNECTIONS
 
-    @patch("app.main.sup_util.active_connections", {1: "ws1", 2: "ws2"})
-    def test_accepts_connections_with_connections(self, client):
+    @patch("app.main.sup_util.active_connections", {"ws1", "ws2"})
+    async def test_accepts_connections_with_connections(self, client):
         """Test accepts connections endpoint with active connections."""
-        response = client.get("/acceptsConnections")
+        response = await client.get("/acceptsConnections")
         assert response.status_code == 200  # noqa: PLR2004
         data = response.json()
         assert data["status"] == "ready"
         assert data["active_connections"] == 2  # noqa: PLR2004
-        assert data["max_connections"] == 50  # noqa: PLR2004
+        assert data["max_connections"] == MAX_CONNECTIONS
 
     @patch("app.main.sup_util.mqtt_connected", True)
-    def test_put_text_message_success(self, client):
+    async def test_put_text_message_success(self, client, monkeypatch):
         """Test successful PUT /text endpoint."""
         # Setup mocks
         mock_config = MagicMock()
         mock_config.text_endpoint_auth_token = "TEST_TOKEN"
         mock_config.input_topic = "assistant/ground_station/input"
         mock_config.broadcast_topic = "assistant/ground_station/broadcast"
-        sup_util._config_obj = mock_config
+        monkeypatch.setattr(sup_util, "_config_obj", mock_config)
 
         mock_mqtt_client = AsyncMock()
         mock_mqtt_client.publish = AsyncMock()
-        sup_util._mqtt_client = mock_mqtt_client
+        monkeypatch.setattr(sup_util, "_mqtt_client", mock_mqtt_client)
 
         # Make request
-        response = client.put(
+        response = await client.put(
             "/text",
             json={"text": "test message", "device_id": "test_device"},
             headers={"Authorization": "Bearer TEST_TOKEN"},
@@ -252,9 +392,9 @@ class TestHTTPEndpoints:
         assert "request_id" in data
         assert len(data["request_id"]) > 0
 
-    def test_put_text_message_missing_auth(self, client):
+    async def test_put_text_message_missing_auth(self, client):
         """Test PUT /text endpoint with missing Authorization header."""
-        response = client.put(
+        response = await client.put(
             "/text",
             json={"text": "test message", "device_id": "test_device"},
         )
@@ -262,13 +402,13 @@ class TestHTTPEndpoints:
         assert response.status_code == 401  # noqa: PLR2004
         assert response.json()["detail"] == "Missing Authorization header"
 
-    def test_put_text_message_invalid_token(self, client):
+    async def test_put_text_message_invalid_token(self, client, monkeypatch):
         """Test PUT /text endpoint with invalid token."""
         mock_config = MagicMock()
         mock_config.text_endpoint_auth_token = "CORRECT_TOKEN"
-        sup_util._config_obj = mock_config
+        monkeypatch.setattr(sup_util, "_config_obj", mock_config)
 
-        response = client.put(
+        response = await client.put(
             "/text",
             json={"text": "test message", "device_id": "test_device"},
             headers={"Authorization": "Bearer WRONG_TOKEN"},
@@ -278,13 +418,13 @@ class TestHTTPEndpoints:
         assert response.json()["detail"] == "Invalid authentication token"
 
     @patch("app.main.sup_util.mqtt_connected", False)
-    def test_put_text_message_mqtt_unavailable(self, client):
+    async def test_put_text_message_mqtt_unavailable(self, client, monkeypatch):
         """Test PUT /text endpoint when MQTT is unavailable."""
         mock_config = MagicMock()
         mock_config.text_endpoint_auth_token = "TEST_TOKEN"
-        sup_util._config_obj = mock_config
+        monkeypatch.setattr(sup_util, "_config_obj", mock_config)
 
-        response = client.put(
+        response = await client.put(
             "/text",
             json={"text": "test message", "device_id": "test_device"},
             headers={"Authorization": "Bearer TEST_TOKEN"},
@@ -294,21 +434,21 @@ class TestHTTPEndpoints:
         assert response.json()["detail"] == "MQTT broker unavailable"
 
     @patch("app.main.sup_util.mqtt_connected", True)
-    def test_put_text_message_mqtt_publish_failure(self, client):
+    async def test_put_text_message_mqtt_publish_failure(self, client, monkeypatch):
         """Test PUT /text endpoint when MQTT publish fails."""
         # Setup mocks
         mock_config = MagicMock()
         mock_config.text_endpoint_auth_token = "TEST_TOKEN"
         mock_config.input_topic = "assistant/ground_station/input"
         mock_config.broadcast_topic = "assistant/ground_station/broadcast"
-        sup_util._config_obj = mock_config
+        monkeypatch.setattr(sup_util, "_config_obj", mock_config)
 
         mock_mqtt_client = AsyncMock()
         mock_mqtt_client.publish = AsyncMock(side_effect=Exception("MQTT publish failed"))
-        sup_util._mqtt_client = mock_mqtt_client
+        monkeypatch.setattr(sup_util, "_mqtt_client", mock_mqtt_client)
 
         # Make request
-        response = client.put(
+        response = await client.put(
             "/text",
             json={"text": "test message", "device_id": "test_device"},
             headers={"Authorization": "Bearer TEST_TOKEN"},
@@ -319,21 +459,21 @@ class TestHTTPEndpoints:
         assert "Failed to publish message to MQTT broker" in response.json()["detail"]
 
     @patch("app.main.sup_util.mqtt_connected", True)
-    def test_put_text_message_bearer_prefix_handling(self, client):
+    async def test_put_text_message_bearer_prefix_handling(self, client, monkeypatch):
         """Test PUT /text endpoint handles various Bearer token formats."""
         # Setup mocks
         mock_config = MagicMock()
         mock_config.text_endpoint_auth_token = "TEST_TOKEN"
         mock_config.input_topic = "assistant/ground_station/input"
         mock_config.broadcast_topic = "assistant/ground_station/broadcast"
-        sup_util._config_obj = mock_config
+        monkeypatch.setattr(sup_util, "_config_obj", mock_config)
 
         mock_mqtt_client = AsyncMock()
         mock_mqtt_client.publish = AsyncMock()
-        sup_util._mqtt_client = mock_mqtt_client
+        monkeypatch.setattr(sup_util, "_mqtt_client", mock_mqtt_client)
 
         # Test with extra spaces
-        response = client.put(
+        response = await client.put(
             "/text",
             json={"text": "test message", "device_id": "test_device"},
             headers={"Authorization": "Bearer  TEST_TOKEN  "},
@@ -341,9 +481,9 @@ class TestHTTPEndpoints:
 
         assert response.status_code == 200  # noqa: PLR2004
 
-    def test_put_text_message_invalid_request_body(self, client):
+    async def test_put_text_message_invalid_request_body(self, client):
         """Test PUT /text endpoint with invalid request body."""
-        response = client.put(
+        response = await client.put(
             "/text",
             json={"text": "test message"},  # missing device_id
             headers={"Authorization": "Bearer TEST_TOKEN"},
@@ -367,7 +507,9 @@ class TestWebSocketHandling:
             mock.mqtt_client = AsyncMock()
             mock.config_obj = MagicMock()
             mock.config_obj.broadcast_topic = "test/broadcast"
+            mock.config_obj.output_queue_max_size = 64
             mock.mqtt_subscription_to_queue = {}
+            mock.processor_pool = deque()
             yield mock
 
     @patch("app.utils.processing_sound.SatelliteAudioProcessor")
@@ -383,12 +525,12 @@ class TestWebSocketHandling:
             "room": "test_room",
         }
 
-        mock_websocket.receive_json.return_value = client_config_data
+        mock_websocket.receive_text.return_value = json.dumps(client_config_data)
 
         mock_client_conf = MagicMock()
         mock_client_conf.room = "test_room"
         mock_client_conf.output_topic = "assistant/test_room/output"
-        mock_client_config.model_validate.return_value = mock_client_conf
+        mock_client_config.model_validate_json.return_value = mock_client_conf
 
         mock_audio_processor = MagicMock()
         mock_processor.return_value = mock_audio_processor
@@ -399,24 +541,69 @@ class TestWebSocketHandling:
         # Verify results
         assert client_conf is mock_client_conf
         assert isinstance(output_queue, asyncio.Queue)
+        assert output_queue.maxsize == 64  # noqa: PLR2004
         assert audio_processor is mock_audio_processor
 
         # Verify WebSocket interaction
-        mock_websocket.receive_json.assert_called_once()
+        mock_websocket.receive_text.assert_called_once()
+        mock_client_config.model_validate_json.assert_called_once_with(json.dumps(client_config_data))
 
         # Verify MQTT subscription
         mock_sup_util.mqtt_client.subscribe.assert_called_once_with("assistant/test_room/output", qos=1)
 
+        # Broadcast topic must not be aliased to this satellite's queue
+        assert mock_sup_util.mqtt_subscription_to_queue == {"assistant/test_room/output": output_queue}
+
+    @patch("app.utils.processing_sound.SatelliteAudioProcessor")
+    async def test_setup_satellite_connection_reuses_pooled_processor(
+        self, mock_processor, mock_websocket, mock_sup_util
+    ):
+        """Test that a pooled processor is rebound instead of allocating a new one."""
+        mock_websocket.receive_text.return_value = json.dumps(
+            {"samplerate": 16000, "input_channels": 1, "output_channels": 1, "chunk_size": 1024, "room": "kitchen"}
+        )
+        pooled_processor = MagicMock()
+        mock_sup_util.processor_pool.append(pooled_processor)
+
+        client_conf, _, audio_processor = await setup_satellite_connection(mock_websocket)
+
+        assert audio_processor is pooled_processor
+        pooled_processor.reset.assert_called_once_with(mock_websocket, client_conf)
+        mock_processor.assert_not_called()
+        assert not mock_sup_util.processor_pool
+
     async def test_setup_satellite_connection_invalid_config(self, mock_websocket):
         """Test satellite connection setup with invalid config."""
         # Setup invalid config data
-        mock_websocket.receive_json.return_value = {"invalid": "config"}
+        mock_websocket.receive_text.return_value = '{"invalid": "config"}'
+
+        # pydantic.ValidationError subclasses ValueError, which websocket_endpoint maps to close code 1002
+        with pytest.raises(ValueError):
+            await setup_satellite_connection(mock_websocket)
+
+    @patch("app.main.process_output_queue")
+    async def test_handle_satellite_messages_routing(self, mock_process_output, mock_websocket):
+        """Test audio and control frames are routed until disconnect."""
 
-        with patch("app.utils.client_config.ClientConfig.model_validate") as mock_validate:
-            mock_validate.side_effect = ValueError("Invalid configuration")
+        async def idle_output(*_args, **_kwargs):
+            await asyncio.Event().wait()
 
-            with pytest.raises(ValueError):
-                await setup_satellite_connection(mock_websocket)
+        mock_process_output.side_effect = idle_output
+        mock_websocket.receive.side_effect = [
+            {"type": "websocket.receive", "text": "START_COMMAND"},
+            {"type": "websocket.receive", "bytes": b"audio"},
+            {"type": "websocket.receive", "text": "END_COMMAND"},
+            {"type": "websocket.disconnect", "code": 1000},
+        ]
+        audio_processor = AsyncMock()
+
+        await handle_satellite_messages(mock_websocket, audio_processor, asyncio.Queue(), MagicMock())
+
+        assert [call.args[0] for call in audio_processor.handle_control_signal.call_args_list] == [
+            "START_COMMAND",
+            "END_COMMAND",
+        ]
+        audio_processor.handle_audio_data.assert_called_once_with(b"audio")
 
 
 class TestWebSocketEndpoint:
@@ -434,7 +621,7 @@ class TestWebSocketEndpoint:
         """Test successful WebSocket endpoint execution."""
 
         # Setup mocks
-        mock_sup_util.active_connections = {}
+        mock_sup_util.active_connections = set()
         mock_client_conf = MagicMock()
         mock_client_conf.output_topic = "test/output"
         mock_output_queue = AsyncMock()
@@ -459,8 +646,7 @@ class TestWebSocketEndpoint:
         """Test WebSocket endpoint with duplicate connection."""
 
         # Setup existing connection
-        connection_id = id(mock_websocket)
-        mock_sup_util.active_connections = {connection_id: "existing"}
+        mock_sup_util.active_connections = {mock_websocket}
 
         # Call endpoint
         await websocket_endpoint(mock_websocket)
@@ -468,13 +654,128 @@ class TestWebSocketEndpoint:
         # Verify WebSocket closed
         mock_websocket.close.assert_called_once_with(code=1001, reason="Connection already exists")
 
+    @patch("app.main.setup_satellite_connection")
+    @patch("app.main.handle_satellite_messages", new=AsyncMock())
+    @patch("app.main.sup_util")
+    async def test_websocket_endpoint_returns_processor_to_pool(self, mock_sup_util, mock_setup, mock_websocket):
+        """Test that the audio processor is released and pooled when the satellite disconnects."""
+        mock_sup_util.active_connections = set()
+        mock_sup_util.mqtt_subscription_to_queue = {}
+        mock_sup_util.processor_pool = deque()
+        mock_audio_processor = MagicMock()
+        mock_setup.return_value = (MagicMock(), AsyncMock(), mock_audio_processor)
+
+        await websocket_endpoint(mock_websocket)
+
+        mock_audio_processor.release.assert_called_once()
+        assert list(mock_sup_util.processor_pool) == [mock_audio_processor]
+
+    @patch("app.main.setup_satellite_connection")
+    @patch("app.main.handle_satellite_messages", new=AsyncMock())
+    @patch("app.main.sup_util")
+    async def test_pooled_processor_holds_no_buffer_or_websocket(self, mock_sup_util, mock_setup, mock_websocket):
+        """Test that a processor returned to the pool keeps neither its audio buffer nor the closed socket."""
+        mock_sup_util.active_connections = set()
+        mock_sup_util.mqtt_subscription_to_queue = {}
+        mock_sup_util.processor_pool = deque()
+        client_conf = ClientConfig(samplerate=16000, input_channels=1, output_channels=1, chunk_size=1024, room="x")
+        processor = SatelliteAudioProcessor(
+            mock_websocket, Config(), client_conf, logging.getLogger("test"), MagicMock()
+        )
+        await processor.handle_control_signal("START_COMMAND")
+        mock_setup.return_value = (client_conf, AsyncMock(), processor)
+
+        await websocket_endpoint(mock_websocket)
+
+        assert list(mock_sup_util.processor_pool) == [processor]
+        assert len(processor._audio_data) == 0
+        assert processor._websocket is None
+        assert processor._client_conf is None
+
+    @patch("app.main.setup_satellite_connection")
+    @patch("app.main.handle_satellite_messages", new=AsyncMock())
+    @patch("app.main.sup_util")
+    async def test_websocket_endpoint_pool_is_capped(self, mock_sup_util, mock_setup, mock_websocket):
+        """Test that processors are dropped once the pool is full."""
+        mock_sup_util.active_connections = set()
+        mock_sup_util.mqtt_subscription_to_queue = {}
+        mock_sup_util.processor_pool = deque(MagicMock() for _ in range(PROCESSOR_POOL_MAX_SIZE))
+        mock_audio_processor = MagicMock()
+        mock_setup.return_value = (MagicMock(), AsyncMock(), mock_audio_processor)
+
+        await websocket_endpoint(mock_websocket)
+
+        assert len(mock_sup_util.processor_pool) == PROCESSOR_POOL_MAX_SIZE
+        assert mock_audio_processor not in mock_sup_util.processor_pool
+
+    @patch("app.main.setup_satellite_connection")
+    @patch("app.main.sup_util")
+    async def test_websocket_endpoint_at_capacity(self, mock_sup_util, mock_setup, mock_websocket):
+        """Test that connections beyond MAX_CONNECTIONS are closed with 1013 without taking a slot."""
+        mock_sup_util.active_connections = {MagicMock() for _ in range(MAX_CONNECTIONS)}
+
+        await websocket_endpoint(mock_websocket)
+
+        handshake_calls = [name for name, *_ in mock_websocket.mock_calls if name in {"accept", "close"}]
+        assert handshake_calls == ["accept", "close"]
+        mock_websocket.close.assert_called_once_with(code=1013, reason="Ground station at capacity")
+        mock_setup.assert_not_called()
+        assert mock_websocket not in mock_sup_util.active_connections
+
+    @patch("app.main.setup_satellite_connection")
+    @patch("app.main.handle_satellite_messages", new=AsyncMock())
+    @patch("app.main.sup_util")
+    async def test_websocket_endpoint_concurrent_handshakes_respect_capacity(self, mock_sup_util, mock_setup):
+        """Test that the capacity check and slot reservation cannot interleave across handshakes."""
+        mock_sup_util.active_connections = {MagicMock() for _ in range(MAX_CONNECTIONS - 1)}
+        mock_sup_util.mqtt_subscription_to_queue = {}
+        mock_sup_util.processor_pool = deque()
+        mock_setup.return_value = (MagicMock(), AsyncMock(), MagicMock())
+        release_accept = asyncio.Event()
+        first, second = AsyncMock(), AsyncMock()
+        first.accept.side_effect = release_accept.wait
+
+        first_task = asyncio.create_task(websocket_endpoint(first))
+        await asyncio.sleep(0)
+        await websocket_endpoint(second)
+
+        second.close.assert_called_once_with(code=1013, reason="Ground station at capacity")
+        assert second not in mock_sup_util.active_connections
+
+        release_accept.set()
+        await first_task
+        assert first not in mock_sup_util.active_connections
+
+    @patch("app.main.sup_util")
+    async def test_websocket_endpoint_mqtt_unavailable(self, mock_sup_util, mock_websocket):
+        """Test that a connection is closed and its slot released when MQTT is down."""
+        mock_sup_util.active_connections = set()
+        mock_sup_util.mqtt_connected = False
+        mock_sup_util.mqtt_subscription_to_queue = {}
+
+        await websocket_endpoint(mock_websocket)
+
+        mock_websocket.accept.assert_called_once()
+        mock_websocket.close.assert_called_once_with(code=1011, reason="MQTT broker unavailable")
+        assert mock_websocket not in mock_sup_util.active_connections
+
+    def test_websocket_at_capacity_close_code_reaches_client(self, monkeypatch):
+        """Test that a satellite over the limit receives close code 1013 rather than a handshake rejection."""
+        monkeypatch.setattr(sup_util, "active_connections", {MagicMock() for _ in range(MAX_CONNECTIONS)})
+
+        with TestClient(app).websocket_connect("/satellite") as websocket, pytest.raises(WebSocketDisconnect) as exc:
+            websocket.receive_text()
+
+        assert exc.value.code == 1013  # noqa: PLR2004
+        assert exc.value.reason == "Ground station at capacity"
+
     @patch("app.main.setup_satellite_connection")
     @patch("app.main.sup_util")
     async def test_websocket_endpoint_setup_error(self, mock_sup_util, mock_setup, mock_websocket):
         """Test WebSocket endpoint with setup error."""
 
         # Setup mocks
-        mock_sup_util.active_connections = {}
+        mock_sup_util.active_connections = set()
         mock_setup.side_effect = ValueError("Configuration error")
 
         # Call endpoint
@@ -489,7 +790,7 @@ class TestWebSocketEndpoint:
         """Test WebSocket endpoint with unexpected error."""
 
         # Setup mocks
-        mock_sup_util.active_connections = {}
+        mock_sup_util.active_connections = set()
         mock_setup.side_effect = Exception("Unexpected error")
 
         # Call endpoint
@@ -501,26 +802,177 @@ class TestWebSocketEndpoint:
         assert len(mock_sup_util.active_connections) == 0
 
 
-class TestMessageDecoding:
-    """Test message decoding edge cases."""
-
-    def test_decode_empty_bytes(self):
-        """Test decoding empty bytes."""
-        result = decode_message_payload(b"")
-        assert result == ""
+class TestProcessOutputQueue:
+    """Test delivery of MQTT responses to a satellite."""
 
-    def test_decode_empty_string(self):
-        """Test decoding empty string."""
-        result = decode_message_payload("")
-        assert result == ""
+    @pytest.fixture
+    def websocket(self):
+        """Create a WebSocket that records sent frames."""
+        return FakeWebSocket()
 
-    def test_decode_none(self):
-        """Test decoding None."""
-        result = decode_message_payload(None)
-        assert result is None
+    @pytest.fixture
+    def config_obj(self):
+        """Create configuration with TTS streaming disabled."""
+        return Config()
 
-    def test_decode_invalid_utf8(self):
-        """Test decoding invalid UTF-8 bytes."""
-        invalid_bytes = b"\xff\xfe\xfd"
-        with pytest.raises(UnicodeDecodeError):
-            decode_message_payload(invalid_bytes)
+    @pytest.fixture
+    def client_conf(self):
+        """Create mock client configuration."""
+        client_conf = MagicMock()
+        client_conf.samplerate = 16000
+        return client_conf
+
+    @patch("app.main.speech_recognition_tools.send_text_to_tts_api")
+    async def test_waits_for_response(self, mock_tts, websocket, client_conf, config_obj):
+        """Test that processing blocks until a response is queued."""
+        mock_tts.return_value = b"audio"
+        output_queue: asyncio.Queue[messages.Response] = asyncio.Queue()
+
+        task = asyncio.create_task(process_output_queue(websocket, output_queue, config_obj, client_conf))
+        await asyncio.sleep(0)
+        assert not task.done()
+
+        output_queue.put_nowait(messages.Response(text="hello"))
+        await task
+
+        mock_tts.assert_called_once()
+        assert websocket.sent == [("send_bytes", b"audio")]
+
+    @patch("app.main.speech_recognition_tools.send_text_to_tts_api")
+    async def test_drains_up_to_cap(self, mock_tts, websocket, client_conf, config_obj):
+        """Test that at most three queued responses are handled per call."""
+        mock_tts.return_value = b"audio"
+        output_queue: asyncio.Queue[messages.Response] = asyncio.Queue()
+        for i in range(5):
+            output_queue.put_nowait(messages.Response(text=f"response {i}"))
+
+        await process_output_queue(websocket, output_queue, config_obj, client_conf)
+
+        assert len(websocket.bytes_sent) == 3  # noqa: PLR2004
+        assert output_queue.qsize() == 2  # noqa: PLR2004
+
+    @patch("app.main.speech_recognition_tools.send_text_to_tts_api")
+    async def test_tts_requests_run_concurrently(self, mock_tts, websocket, client_conf, config_obj):
+        """Test that TTS requests overlap while audio is sent in queue order."""
+        in_flight = 0
+        max_in_flight = 0
+
+        async def fake_tts(text, *_args, **_kwargs):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return text.encode()
+
+        mock_tts.side_effect = fake_tts
+        output_queue: asyncio.Queue[messages.Response] = asyncio.Queue()
+        for text in ("first", "second", "third"):
+            output_queue.put_nowait(messages.Response(text=text))
+
+        await process_output_queue(websocket, output_queue, config_obj, client_conf)
+
+        assert max_in_flight == 3  # noqa: PLR2004
+        assert websocket.bytes_sent == [b"first", b"second", b"third"]
+
+    @patch("app.main.speech_recognition_tools.send_text_to_tts_api")
+    async def test_alert_sent_before_tts_completes(self, mock_tts, websocket, client_conf, config_obj):
+        """Test that the alert signal does not wait for speech synthesis."""
+        tts_started = asyncio.Event()
+        release_tts = asyncio.Event()
+
+        async def fake_tts(*_args, **_kwargs):
+            tts_started.set()
+            await release_tts.wait()
+            return b"audio"
+
+        mock_tts.side_effect = fake_tts
+        output_queue: asyncio.Queue[messages.Response] = asyncio.Queue()
+        output_queue.put_nowait(messages.Response(text="alert", alert=messages.Alert(play_before=True)))
+
+        task = asyncio.create_task(process_output_queue(websocket, output_queue, config_obj, client_conf))
+        await tts_started.wait()
+        await asyncio.sleep(0)
+
+        assert websocket.sent == [("send_text", "alert_default")]
+
+        release_tts.set()
+        await task
+        assert websocket.sent == [("send_text", "alert_default"), ("send_bytes", b"audio")]
+
+    @patch("app.main.asyncio.create_task")
+    @patch("app.main.speech_recognition_tools.send_text_to_tts_api")
+    async def test_single_response_skips_task_setup(
+        self, mock_tts, mock_create_task, websocket, client_conf, config_obj
+    ):
+        """Test that a lone queued response is synthesized inline."""
+        mock_tts.return_value = b"audio"
+        output_queue: asyncio.Queue[messages.Response] = asyncio.Queue()
+        output_queue.put_nowait(messages.Response(text="only", alert=messages.Alert(play_before=True)))
+
+        await process_output_queue(websocket, output_queue, config_obj, client_conf)
+
+        mock_create_task.assert_not_called()
+        assert websocket.sent == [("send_text", "alert_default"), ("send_bytes", b"audio")]
+
+    @patch("app.main.speech_recognition_tools.send_text_to_tts_api")
+    async def test_single_response_tts_failure(self, mock_tts, websocket, client_conf, config_obj, caplog):
+        """Test that a failing TTS request for a lone response is logged, not raised."""
+        mock_tts.side_effect = RuntimeError("tts down")
+        output_queue: asyncio.Queue[messages.Response] = asyncio.Queue()
+        output_queue.put_nowait(messages.Response(text="only"))
+
+        with caplog.at_level(logging.ERROR):
+            await process_output_queue(websocket, output_queue, config_obj, client_conf)
+
+        assert "TTS request failed" in caplog.text
+        assert websocket.sent == []
+
+    @patch("app.main.speech_recognition_tools.stream_text_to_tts_api")
+    async def test_streaming_forwards_chunks(self, mock_stream, websocket, client_conf):
+        """Test that streamed TTS chunks are sent as they arrive, after the alert."""
+
+        async def fake_stream(text, *_args, **_kwargs):
+            for part in (b"-a", b"-b"):
+                yield text.encode() + part
+
+        mock_stream.side_effect = fake_stream
+        output_queue: asyncio.Queue[messages.Response] = asyncio.Queue()
+        output_queue.put_nowait(messages.Response(text="first", alert=messages.Alert(play_before=True)))
+        output_queue.put_nowait(messages.Response(text="second"))
+
+        await process_output_queue(websocket, output_queue, Config(tts_stream_chunk_size=2), client_conf)
+
+        assert mock_stream.call_args.kwargs["chunk_size"] == 2  # noqa: PLR2004
+        assert websocket.sent == [
+            ("send_text", "alert_default"),
+            ("send_bytes", b"first-a"),
+            ("send_bytes", b"first-b"),
+            ("send_bytes", b"second-a"),
+            ("send_bytes", b"second-b"),
+        ]
+
+    @patch("app.main.speech_recognition_tools.stream_text_to_tts_api")
+    async def test_streaming_stops_on_disconnect(self, mock_stream, websocket, client_conf):
+        """Test that a closed WebSocket stops streaming and closes the TTS stream."""
+        closed = False
+
+        async def fake_stream(*_args, **_kwargs):
+            nonlocal closed
+            try:
+                yield b"chunk-1"
+                yield b"chunk-2"
+            finally:
+                closed = True
+
+        mock_stream.side_effect = fake_stream
+        websocket.send_error = WebSocketDisconnect()
+        output_queue: asyncio.Queue[messages.Response] = asyncio.Queue()
+        output_queue.put_nowait(messages.Response(text="first"))
+        output_queue.put_nowait(messages.Response(text="second"))
+
+        await process_output_queue(websocket, output_queue, Config(tts_stream_chunk_size=2), client_conf)
+
+        mock_stream.assert_called_once()
+        assert websocket.sent == [("send_bytes", b"chunk-1")]
+        assert closed
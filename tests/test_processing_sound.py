@@ -3,11 +3,12 @@
 import logging
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import numpy as np
 import pytest
 
 from app.utils.client_config import ClientConfig
 from app.utils.config import Config
-from app.utils.processing_sound import AudioConfig, ProcessingState, SatelliteAudioProcessor
+from app.utils.processing_sound import AudioConfig, ProcessingState, SatelliteAudioProcessor, _error_beep_bytes
 from app.utils.support_utils import SupportUtils
 
 
@@ -28,6 +29,10 @@ class TestAudioConfig:
         assert config.max_frames == 32000  # noqa: PLR2004
         assert config.max_buffer_size == 512 * 1024
 
+    def test_audio_config_is_slotted(self):
+        """Test that AudioConfig instances have no per-instance __dict__."""
+        assert not hasattr(AudioConfig(max_frames=16000), "__dict__")
+
 
 class TestSatelliteAudioProcessor:
     """Test SatelliteAudioProcessor class."""
@@ -37,7 +42,7 @@ class TestSatelliteAudioProcessor:
         """Create mock WebSocket."""
         return AsyncMock()
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def config_obj(self):
         """Create test configuration."""
         return Config(
@@ -46,7 +51,7 @@ class TestSatelliteAudioProcessor:
             max_command_input_seconds=30,
         )
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def client_conf(self):
         """Create test client configuration."""
         return ClientConfig(samplerate=16000, input_channels=1, output_channels=1, chunk_size=1024, room="test_room")
@@ -58,7 +63,7 @@ class TestSatelliteAudioProcessor:
         sup_util.mqtt_client = AsyncMock()
         return sup_util
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def logger(self):
         """Create test logger."""
         return logging.getLogger("test")
@@ -73,15 +78,80 @@ class TestSatelliteAudioProcessor:
     def test_processor_initialization(self, processor):
         """Test processor initialization."""
         assert processor.state == ProcessingState.IDLE
-        assert processor.audio_buffer == []
+        assert processor.audio_buffer == b""
         assert processor._buffer_size_bytes == 0
 
+    def test_processor_is_slotted(self, processor):
+        """Test that the slotted processor has no per-instance __dict__."""
+        assert not hasattr(processor, "__dict__")
+        with pytest.raises(AttributeError):
+            processor.unknown_attribute = True
+
+    async def test_reset_rebinds_processor(self, processor, config_obj):
+        """Test that reset binds a pooled processor to a new satellite and drops old audio."""
+        await processor.handle_control_signal("START_COMMAND")
+        await processor.handle_audio_data(b"\x00\x01" * 10)
+        new_websocket = AsyncMock()
+        new_client_conf = ClientConfig(
+            samplerate=8000, input_channels=1, output_channels=1, chunk_size=512, room="kitchen"
+        )
+
+        processor.reset(new_websocket, new_client_conf)
+
+        assert processor.websocket is new_websocket
+        assert processor.client_conf is new_client_conf
+        assert processor.audio_config.max_frames == config_obj.max_command_input_seconds * 8000
+        assert processor.state == ProcessingState.IDLE
+        assert processor.audio_buffer == b""
+        assert processor._buffer_size_bytes == 0
+
+    async def test_clear_drops_collected_audio(self, processor):
+        """Test that clear returns the processor to idle with an empty buffer."""
+        await processor.handle_control_signal("START_COMMAND")
+        await processor.handle_audio_data(b"\x00\x01" * 10)
+
+        processor.clear()
+
+        assert processor.state == ProcessingState.IDLE
+        assert processor.audio_buffer == b""
+        assert processor._buffer_size_bytes == 0
+
+    async def test_release_frees_buffer_and_connection(self, processor):
+        """Test that a released processor holds no audio buffer, WebSocket or client config."""
+        await processor.handle_control_signal("START_COMMAND")
+        await processor.handle_audio_data(b"\x00\x01" * 10)
+        assert len(processor._audio_data) == processor.audio_config.max_buffer_size
+
+        processor.release()
+
+        assert processor.state == ProcessingState.IDLE
+        assert len(processor._audio_data) == 0
+        assert processor._websocket is None
+        assert processor._client_conf is None
+        with pytest.raises(ValueError, match="not bound to a WebSocket"):
+            _ = processor.websocket
+
+    async def test_released_processor_can_be_reset(self, processor):
+        """Test that a released processor works again after reset."""
+        processor.release()
+        new_websocket = AsyncMock()
+        new_client_conf = ClientConfig(
+            samplerate=16000, input_channels=1, output_channels=1, chunk_size=512, room="kitchen"
+        )
+
+        processor.reset(new_websocket, new_client_conf)
+        await processor.handle_control_signal("START_COMMAND")
+        await processor.handle_audio_data(b"\x01\x02")
+
+        assert processor.websocket is new_websocket
+        assert processor.audio_buffer == b"\x01\x02"
+
     async def test_start_audio_collection(self, processor):
         """Test starting audio collection."""
         await processor.handle_control_signal("START_COMMAND")
 
         assert processor.state == ProcessingState.COLLECTING_AUDIO
-        assert processor.audio_buffer == []
+        assert processor.audio_buffer == b""
         assert processor._buffer_size_bytes == 0
 
     async def test_start_audio_collection_when_not_idle(self, processor, logger):
@@ -96,14 +166,13 @@ class TestSatelliteAudioProcessor:
 
     async def test_cancel_processing(self, processor):
         """Test canceling audio processing."""
-        processor.state = ProcessingState.COLLECTING_AUDIO
-        processor.audio_buffer = [b"test"]
-        processor._buffer_size_bytes = 4
+        await processor.handle_control_signal("START_COMMAND")
+        await processor.handle_audio_data(b"test")
 
         await processor.handle_control_signal("CANCEL_COMMAND")
 
         assert processor.state == ProcessingState.IDLE
-        assert processor.audio_buffer == []
+        assert processor.audio_buffer == b""
         assert processor._buffer_size_bytes == 0
 
     async def test_handle_audio_data_when_collecting(self, processor):
@@ -113,10 +182,42 @@ class TestSatelliteAudioProcessor:
         audio_data = b"test_audio_data"
         await processor.handle_audio_data(audio_data)
 
-        assert len(processor.audio_buffer) == 1
-        assert processor.audio_buffer[0] == audio_data
+        assert processor.audio_buffer == audio_data
         assert processor._buffer_size_bytes == len(audio_data)
 
+    async def test_handle_audio_data_appends_chunks(self, processor):
+        """Test that consecutive chunks are written contiguously into the reused buffer."""
+        await processor.handle_control_signal("START_COMMAND")
+        await processor.handle_audio_data(b"\x01\x02")
+        await processor.handle_audio_data(b"\x03\x04\x05\x06")
+
+        assert processor.audio_buffer == b"\x01\x02\x03\x04\x05\x06"
+
+        # A new command starts from an empty buffer without reallocating it
+        audio_data = processor._audio_data
+        await processor.handle_control_signal("CANCEL_COMMAND")
+        await processor.handle_control_signal("START_COMMAND")
+        await processor.handle_audio_data(b"\x07\x08")
+
+        assert processor.audio_buffer == b"\x07\x08"
+        assert processor._audio_data is audio_data
+
+    async def test_chunk_debug_log_follows_level(self, processor, logger):
+        """Test that the per-chunk debug log is only emitted when debug logging is enabled."""
+        await processor.handle_control_signal("START_COMMAND")
+
+        try:
+            with patch.object(logger, "debug") as mock_debug:
+                logger.setLevel(logging.INFO)
+                await processor.handle_audio_data(b"\x01\x02")
+                mock_debug.assert_not_called()
+
+                logger.setLevel(logging.DEBUG)
+                await processor.handle_audio_data(b"\x03\x04")
+                mock_debug.assert_called_once_with("Collected audio chunk (buffer size: %d bytes)", 4)
+        finally:
+            logger.setLevel(logging.NOTSET)
+
     async def test_handle_audio_data_when_not_collecting(self, processor, logger):
         """Test handling audio data when not collecting."""
         with patch.object(logger, "warning") as mock_warning:
@@ -132,7 +233,7 @@ class TestSatelliteAudioProcessor:
         # Set a small buffer size for testing
         processor.audio_config.max_buffer_size = 10
 
-        with patch.object(processor, "_process_collected_audio") as mock_process:
+        with patch.object(SatelliteAudioProcessor, "_process_collected_audio") as mock_process:
             # Add data that exceeds buffer limit
             await processor.handle_audio_data(b"12345678901234567890")
             mock_process.assert_called_once()
@@ -149,6 +250,31 @@ class TestSatelliteAudioProcessor:
         expected_bytes = expected_samples * 2
         assert len(beep_data) == expected_bytes
 
+    def test_generate_error_beep_is_cached(self, processor):
+        """Test that repeated beeps reuse the synthesized buffer."""
+        first = processor._generate_error_beep()
+        second = processor._generate_error_beep()
+
+        assert first is second
+
+    def test_error_beep_fades_in_and_out(self):
+        """Test that the beep starts and ends silent and stays within int16 range."""
+        samples = np.frombuffer(_error_beep_bytes(16000, 0.5, 800), dtype=np.int16)
+
+        assert samples[0] == 0
+        assert samples[-1] == 0
+        assert np.abs(samples).max() > 30000  # noqa: PLR2004
+
+    def test_error_beep_rounds_to_nearest(self):
+        """Test that PCM conversion rounds instead of truncating toward zero."""
+        sample_rate, frequency = 16000, 800
+        samples = np.frombuffer(_error_beep_bytes(sample_rate, 0.5, frequency), dtype=np.int16)
+
+        # Mid-tone, past the fade-in, the samples are the rounded scaled sine
+        index = np.arange(1000, 1100)
+        expected = np.rint(32767 * np.sin(np.float32(2 * np.pi * frequency / sample_rate) * index.astype(np.float32)))
+        np.testing.assert_array_equal(samples[index], expected)
+
     async def test_send_error_feedback(self, processor, mock_websocket):
         """Test sending error feedback."""
         await processor._send_error_feedback()
@@ -182,15 +308,20 @@ class TestSatelliteAudioProcessor:
         # Process audio
         await processor._process_collected_audio()
 
-        # Verify STT was called
+        # Verify STT was called with the collected audio in order
         mock_stt.assert_called_once()
+        expected = np.frombuffer(b"audio_data_1audio_data_2", dtype=np.int16).astype(np.float32) / 32768
+        np.testing.assert_allclose(mock_stt.call_args.args[0], expected)
 
-        # Verify MQTT publish was called
-        sup_util.mqtt_client.publish.assert_called_once()
+        # Verify the STT result was published
+        sup_util.publish_request.assert_awaited_once()
+        request = sup_util.publish_request.call_args.args[0]
+        assert request.text == "test transcription"
+        assert request.room == "test_room"
 
         # Verify state reset
         assert processor.state == ProcessingState.IDLE
-        assert processor.audio_buffer == []
+        assert processor.audio_buffer == b""
         assert processor._buffer_size_bytes == 0
 
     @patch("app.utils.processing_sound.srt.send_audio_to_stt_api")
@@ -203,7 +334,7 @@ class TestSatelliteAudioProcessor:
         # Mock STT failure
         mock_stt.return_value = None
 
-        with patch.object(processor, "_send_error_feedback") as mock_error:
+        with patch.object(SatelliteAudioProcessor, "_send_error_feedback") as mock_error:
             await processor._process_collected_audio()
             mock_error.assert_called_once()
 
@@ -230,10 +361,23 @@ class TestSatelliteAudioProcessor:
         max_samples = processor.audio_config.max_frames
         large_audio = b"x" * (max_samples * 2 + 100)  # Exceed by 50 samples
 
-        with patch.object(processor, "_process_collected_audio") as mock_process:
+        with patch.object(SatelliteAudioProcessor, "_process_collected_audio") as mock_process:
             await processor.handle_audio_data(large_audio)
             mock_process.assert_called_once()
 
+    async def test_max_audio_duration_across_chunks(self, processor):
+        """Test that the duration limit counts samples accumulated over many chunks."""
+        await processor.handle_control_signal("START_COMMAND")
+        processor.audio_config.max_frames = 10
+
+        with patch.object(SatelliteAudioProcessor, "_process_collected_audio") as mock_process:
+            for _ in range(5):
+                await processor.handle_audio_data(b"\x00\x01" * 2)
+            mock_process.assert_not_called()
+
+            await processor.handle_audio_data(b"\x00\x01" * 2)
+            mock_process.assert_called_once()
+
     async def test_end_command_when_not_collecting(self, processor, logger):
         """Test END_COMMAND when not currently collecting audio."""
         with patch.object(logger, "warning") as mock_warning:
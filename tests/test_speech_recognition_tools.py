@@ -1,5 +1,6 @@
 """Tests for speech recognition tools module."""
 
+import json
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import httpx
@@ -7,7 +8,15 @@ import numpy as np
 import pytest
 
 from app.utils.config import Config
-from app.utils.speech_recognition_tools import STTResponse, int2float, send_audio_to_stt_api, send_text_to_tts_api
+from app.utils.speech_recognition_tools import (
+    STTResponse,
+    close_http_client,
+    get_http_client,
+    int2float,
+    send_audio_to_stt_api,
+    send_text_to_tts_api,
+    stream_text_to_tts_api,
+)
 
 
 class TestUtilityFunctions:
@@ -35,6 +44,15 @@ class TestUtilityFunctions:
         assert float_data.dtype == np.float32
         assert np.all(float_data == 0.0)
 
+    def test_int2float_matches_reference_scaling(self):
+        """Test that the fused conversion matches a float32 cast followed by scaling."""
+        rng = np.random.default_rng(0)
+        int_data = rng.integers(-32768, 32767, size=(1024, 1), dtype=np.int16)
+        float_data = int2float(int_data)
+
+        assert float_data.shape == (1024,)
+        np.testing.assert_array_equal(float_data, int_data.astype(np.float32).squeeze() / np.float32(32768))
+
     def test_int2float_max_values(self):
         """Test conversion with maximum values."""
         int_data = np.array([32767, -32768], dtype=np.int16)
@@ -45,6 +63,34 @@ class TestUtilityFunctions:
         assert abs(float_data[1] + 1.0) < 0.01  # noqa: PLR2004
 
 
+class TestHttpClient:
+    """Test the shared HTTP client for the speech APIs."""
+
+    async def test_client_is_reused(self):
+        """Test that calls share one pooled client."""
+        try:
+            assert get_http_client() is get_http_client()
+        finally:
+            await close_http_client()
+
+    async def test_close_releases_client(self):
+        """Test that closing the client makes the next call build a fresh one."""
+        client = get_http_client()
+
+        await close_http_client()
+
+        assert client.is_closed
+        new_client = get_http_client()
+        try:
+            assert new_client is not client
+        finally:
+            await close_http_client()
+
+    async def test_close_without_client(self):
+        """Test that closing before first use is a no-op."""
+        await close_http_client()
+
+
 class TestSTTResponse:
     """Test STTResponse model."""
 
@@ -88,17 +134,17 @@ class TestSendAudioToSTTAPI:
         """Create test audio data."""
         return np.array([0.1, 0.2, 0.3, 0.4], dtype=np.float32)
 
-    @patch("app.utils.speech_recognition_tools.httpx.AsyncClient")
-    async def test_successful_stt_request(self, mock_client_class, config, audio_data):
+    @patch("app.utils.speech_recognition_tools.get_http_client")
+    async def test_successful_stt_request(self, mock_get_client, config, audio_data):
         """Test successful STT API request."""
         # Setup mock response
         mock_response = MagicMock()
-        mock_response.json.return_value = {"text": "hello world", "message": "success"}
+        mock_response.content = b'{"text": "hello world", "message": "success"}'
         mock_response.raise_for_status.return_value = None
 
         mock_client = AsyncMock()
         mock_client.post.return_value = mock_response
-        mock_client_class.return_value.__aenter__.return_value = mock_client
+        mock_get_client.return_value = mock_client
 
         # Call function
         result = await send_audio_to_stt_api(audio_data, config)
@@ -115,19 +161,19 @@ class TestSendAudioToSTTAPI:
         assert "file" in call_args[1]["files"]
         assert call_args[1]["headers"]["user-token"] == "test-token-123"
 
-    @patch("app.utils.speech_recognition_tools.httpx.AsyncClient")
-    async def test_stt_timeout_error(self, mock_client_class, config, audio_data):
+    @patch("app.utils.speech_recognition_tools.get_http_client")
+    async def test_stt_timeout_error(self, mock_get_client, config, audio_data):
         """Test STT API timeout error."""
         mock_client = AsyncMock()
         mock_client.post.side_effect = httpx.TimeoutException("Request timed out")
-        mock_client_class.return_value.__aenter__.return_value = mock_client
+        mock_get_client.return_value = mock_client
 
         result = await send_audio_to_stt_api(audio_data, config, timeout=1.0)
 
         assert result is None
 
-    @patch("app.utils.speech_recognition_tools.httpx.AsyncClient")
-    async def test_stt_http_error(self, mock_client_class, config, audio_data):
+    @patch("app.utils.speech_recognition_tools.get_http_client")
+    async def test_stt_http_error(self, mock_get_client, config, audio_data):
         """Test STT API HTTP error."""
         mock_response = MagicMock()
         mock_response.status_code = 500
@@ -137,35 +183,70 @@ class TestSendAudioToSTTAPI:
         mock_client.post.side_effect = httpx.HTTPStatusError(
             "Server error", request=MagicMock(), response=mock_response
         )
-        mock_client_class.return_value.__aenter__.return_value = mock_client
+        mock_get_client.return_value = mock_client
 
         result = await send_audio_to_stt_api(audio_data, config)
 
         assert result is None
 
-    @patch("app.utils.speech_recognition_tools.httpx.AsyncClient")
-    async def test_stt_network_error(self, mock_client_class, config, audio_data):
+    @patch("app.utils.speech_recognition_tools.get_http_client")
+    async def test_stt_malformed_response(self, mock_get_client, config, audio_data):
+        """Test STT API response that is not valid JSON."""
+        mock_response = MagicMock()
+        mock_response.content = b"not json"
+        mock_response.raise_for_status.return_value = None
+
+        mock_client = AsyncMock()
+        mock_client.post.return_value = mock_response
+        mock_get_client.return_value = mock_client
+
+        result = await send_audio_to_stt_api(audio_data, config)
+
+        assert result is None
+
+    @patch("app.utils.speech_recognition_tools.get_http_client")
+    async def test_stt_network_error(self, mock_get_client, config, audio_data):
         """Test STT API network error."""
         mock_client = AsyncMock()
         mock_client.post.side_effect = httpx.RequestError("Network error")
-        mock_client_class.return_value.__aenter__.return_value = mock_client
+        mock_get_client.return_value = mock_client
 
         result = await send_audio_to_stt_api(audio_data, config)
 
         assert result is None
 
-    @patch("app.utils.speech_recognition_tools.httpx.AsyncClient")
-    async def test_stt_no_token(self, mock_client_class, config, audio_data):
+    @patch("app.utils.speech_recognition_tools.get_http_client")
+    async def test_stt_raw_body(self, mock_get_client, audio_data):
+        """Test STT upload as a raw octet-stream body."""
+        config = Config(speech_transcription_raw_body=True)
+        mock_response = MagicMock()
+        mock_response.content = b'{"text": "hello", "message": "ok"}'
+        mock_response.raise_for_status.return_value = None
+
+        mock_client = AsyncMock()
+        mock_client.post.return_value = mock_response
+        mock_get_client.return_value = mock_client
+
+        result = await send_audio_to_stt_api(audio_data, config)
+
+        assert result is not None
+        call_kwargs = mock_client.post.call_args[1]
+        assert "files" not in call_kwargs
+        assert np.array_equal(np.frombuffer(call_kwargs["content"], dtype=np.float32), audio_data)
+        assert call_kwargs["headers"]["Content-Type"] == "application/octet-stream"
+
+    @patch("app.utils.speech_recognition_tools.get_http_client")
+    async def test_stt_no_token(self, mock_get_client, audio_data):
         """Test STT API request without token."""
-        config.speech_transcription_api_token = None
+        config = Config(speech_transcription_api="http://test-stt:8000/transcribe")
 
         mock_response = MagicMock()
-        mock_response.json.return_value = {"text": "test", "message": "ok"}
+        mock_response.content = b'{"text": "test", "message": "ok"}'
         mock_response.raise_for_status.return_value = None
 
         mock_client = AsyncMock()
         mock_client.post.return_value = mock_response
-        mock_client_class.return_value.__aenter__.return_value = mock_client
+        mock_get_client.return_value = mock_client
 
         await send_audio_to_stt_api(audio_data, config)
 
@@ -184,8 +265,8 @@ class TestSendTextToTTSAPI:
             speech_synthesis_api="http://test-tts:8080/synthesize", speech_synthesis_api_token="tts-token-456"
         )
 
-    @patch("app.utils.speech_recognition_tools.httpx.AsyncClient")
-    async def test_successful_tts_request(self, mock_client_class, config):
+    @patch("app.utils.speech_recognition_tools.get_http_client")
+    async def test_successful_tts_request(self, mock_get_client, config):
         """Test successful TTS API request."""
         # Setup mock response with audio data
         audio_content = b"fake_audio_data_12345"
@@ -195,7 +276,7 @@ class TestSendTextToTTSAPI:
 
         mock_client = AsyncMock()
         mock_client.post.return_value = mock_response
-        mock_client_class.return_value.__aenter__.return_value = mock_client
+        mock_get_client.return_value = mock_client
 
         # Call function
         result = await send_text_to_tts_api("hello world", config, sample_rate=22050)
@@ -207,12 +288,29 @@ class TestSendTextToTTSAPI:
         mock_client.post.assert_called_once()
         call_args = mock_client.post.call_args
         assert call_args[1]["url"] == config.speech_synthesis_api
-        assert call_args[1]["json"]["text"] == "hello world"
-        assert call_args[1]["json"]["sample_rate"] == 22050  # noqa: PLR2004
+        assert json.loads(call_args[1]["content"]) == {"text": "hello world", "sample_rate": 22050}
+        assert call_args[1]["headers"]["Content-Type"] == "application/json"
         assert call_args[1]["headers"]["user-token"] == "tts-token-456"
 
-    @patch("app.utils.speech_recognition_tools.httpx.AsyncClient")
-    async def test_tts_insufficient_audio_data(self, mock_client_class, config):
+    @patch("app.utils.speech_recognition_tools.get_http_client")
+    async def test_tts_uses_explicit_client(self, mock_get_client, config):
+        """Test that a caller-supplied client is used instead of the shared one."""
+        audio_content = b"fake_audio_data_12345"
+        mock_response = MagicMock()
+        mock_response.content = audio_content
+        mock_response.raise_for_status.return_value = None
+
+        client = AsyncMock()
+        client.post.return_value = mock_response
+
+        result = await send_text_to_tts_api("hello", config, client=client)
+
+        assert result == audio_content
+        client.post.assert_called_once()
+        mock_get_client.assert_not_called()
+
+    @patch("app.utils.speech_recognition_tools.get_http_client")
+    async def test_tts_insufficient_audio_data(self, mock_get_client, config):
         """Test TTS API with insufficient audio data."""
         mock_response = MagicMock()
         mock_response.content = b"x"  # Only 1 byte
@@ -220,25 +318,25 @@ class TestSendTextToTTSAPI:
 
         mock_client = AsyncMock()
         mock_client.post.return_value = mock_response
-        mock_client_class.return_value.__aenter__.return_value = mock_client
+        mock_get_client.return_value = mock_client
 
         result = await send_text_to_tts_api("test", config)
 
         assert result is None
 
-    @patch("app.utils.speech_recognition_tools.httpx.AsyncClient")
-    async def test_tts_timeout_error(self, mock_client_class, config):
+    @patch("app.utils.speech_recognition_tools.get_http_client")
+    async def test_tts_timeout_error(self, mock_get_client, config):
         """Test TTS API timeout error."""
         mock_client = AsyncMock()
         mock_client.post.side_effect = httpx.TimeoutException("Request timed out")
-        mock_client_class.return_value.__aenter__.return_value = mock_client
+        mock_get_client.return_value = mock_client
 
         result = await send_text_to_tts_api("test", config, timeout=0.5)
 
         assert result is None
 
-    @patch("app.utils.speech_recognition_tools.httpx.AsyncClient")
-    async def test_tts_http_error(self, mock_client_class, config):
+    @patch("app.utils.speech_recognition_tools.get_http_client")
+    async def test_tts_http_error(self, mock_get_client, config):
         """Test TTS API HTTP error."""
         mock_response = MagicMock()
         mock_response.status_code = 400
@@ -248,16 +346,16 @@ class TestSendTextToTTSAPI:
         mock_client.post.side_effect = httpx.HTTPStatusError(
             "Client error", request=MagicMock(), response=mock_response
         )
-        mock_client_class.return_value.__aenter__.return_value = mock_client
+        mock_get_client.return_value = mock_client
 
         result = await send_text_to_tts_api("test", config)
 
         assert result is None
 
-    @patch("app.utils.speech_recognition_tools.httpx.AsyncClient")
-    async def test_tts_no_token(self, mock_client_class, config):
+    @patch("app.utils.speech_recognition_tools.get_http_client")
+    async def test_tts_no_token(self, mock_get_client):
         """Test TTS API request without token."""
-        config.speech_synthesis_api_token = None
+        config = Config(speech_synthesis_api="http://test-tts:8080/synthesize")
 
         mock_response = MagicMock()
         mock_response.content = b"audio_data_12345"
@@ -265,7 +363,7 @@ class TestSendTextToTTSAPI:
 
         mock_client = AsyncMock()
         mock_client.post.return_value = mock_response
-        mock_client_class.return_value.__aenter__.return_value = mock_client
+        mock_get_client.return_value = mock_client
 
         await send_text_to_tts_api("test", config)
 
@@ -273,8 +371,8 @@ class TestSendTextToTTSAPI:
         call_args = mock_client.post.call_args
         assert call_args[1]["headers"]["user-token"] == ""
 
-    @patch("app.utils.speech_recognition_tools.httpx.AsyncClient")
-    async def test_tts_default_sample_rate(self, mock_client_class, config):
+    @patch("app.utils.speech_recognition_tools.get_http_client")
+    async def test_tts_default_sample_rate(self, mock_get_client, config):
         """Test TTS API with default sample rate."""
         mock_response = MagicMock()
         mock_response.content = b"audio_data_12345"
@@ -282,10 +380,74 @@ class TestSendTextToTTSAPI:
 
         mock_client = AsyncMock()
         mock_client.post.return_value = mock_response
-        mock_client_class.return_value.__aenter__.return_value = mock_client
+        mock_get_client.return_value = mock_client
 
         await send_text_to_tts_api("test", config)
 
         # Verify default sample rate
         call_args = mock_client.post.call_args
-        assert call_args[1]["json"]["sample_rate"] == 16000  # noqa: PLR2004
+        assert json.loads(call_args[1]["content"])["sample_rate"] == 16000  # noqa: PLR2004
+
+
+class TestStreamTextToTTSAPI:
+    """Test stream_text_to_tts_api function."""
+
+    @pytest.fixture
+    def config(self):
+        """Create test configuration."""
+        return Config(
+            speech_synthesis_api="http://test-tts:8080/synthesize", speech_synthesis_api_token="tts-token-456"
+        )
+
+    @staticmethod
+    def mock_client(handler):
+        """Create an HTTP client answered by an in-process mock transport; use it with async with."""
+        return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    @staticmethod
+    async def collect(stream):
+        return [chunk async for chunk in stream]
+
+    async def test_stream_yields_chunks(self, config):
+        """Test that audio is yielded in chunks of the requested size."""
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200, content=b"0123456789")
+
+        async with self.mock_client(handler) as client:
+            chunks = await self.collect(
+                stream_text_to_tts_api("hello", config, sample_rate=22050, chunk_size=4, client=client)
+            )
+
+        assert chunks == [b"0123", b"4567", b"89"]
+        assert str(requests[0].url) == config.speech_synthesis_api
+        assert requests[0].headers["user-token"] == "tts-token-456"
+        assert json.loads(requests[0].content) == {"text": "hello", "sample_rate": 22050}
+
+    async def test_stream_insufficient_audio_data(self, config):
+        """Test that a body shorter than two bytes yields nothing."""
+        async with self.mock_client(lambda _request: httpx.Response(200, content=b"x")) as client:
+            chunks = await self.collect(stream_text_to_tts_api("test", config, chunk_size=4, client=client))
+
+        assert chunks == []
+
+    async def test_stream_http_error(self, config):
+        """Test that an HTTP error status yields nothing."""
+        async with self.mock_client(lambda _request: httpx.Response(500, content=b"Server Error")) as client:
+            chunks = await self.collect(stream_text_to_tts_api("test", config, chunk_size=4, client=client))
+
+        assert chunks == []
+
+    async def test_stream_network_error_mid_stream(self, config):
+        """Test that a connection dropped mid-body ends the stream after the chunks already received."""
+
+        async def body():
+            yield b"0123"
+            raise httpx.ReadError("connection reset")
+
+        async with self.mock_client(lambda _request: httpx.Response(200, content=body())) as client:
+            chunks = await self.collect(stream_text_to_tts_api("test", config, chunk_size=4, client=client))
+
+        assert chunks == [b"0123"]
@@ -1,10 +1,11 @@
 """Tests for support utilities module."""
 
 import asyncio
+import uuid
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
-from private_assistant_commons import MqttConfig
+from private_assistant_commons import MqttConfig, messages
 
 from app.utils.config import Config
 from app.utils.support_utils import SupportUtils
@@ -24,7 +25,13 @@ class TestSupportUtils:
         assert support_utils._mqtt_config is None
         assert support_utils._mqtt_client is None
         assert support_utils.mqtt_subscription_to_queue == {}
-        assert support_utils.active_connections == {}
+        assert support_utils.active_connections == set()
+
+    def test_rejects_unknown_attributes(self, support_utils):
+        """Test that the slotted instance has no per-instance __dict__."""
+        assert not hasattr(support_utils, "__dict__")
+        with pytest.raises(AttributeError):
+            support_utils.unknown_attribute = True
 
     def test_config_obj_property_not_set(self, support_utils):
         """Test config_obj property when not set."""
@@ -78,31 +85,28 @@ class TestSupportUtils:
         """Test active connections management."""
         # Add connection
         mock_websocket = MagicMock()
-        connection_id = 12345
-        support_utils.active_connections[connection_id] = mock_websocket
+        support_utils.active_connections.add(mock_websocket)
 
-        assert connection_id in support_utils.active_connections
-        assert support_utils.active_connections[connection_id] is mock_websocket
+        assert mock_websocket in support_utils.active_connections
 
         # Remove connection
-        del support_utils.active_connections[connection_id]
-        assert connection_id not in support_utils.active_connections
+        support_utils.active_connections.discard(mock_websocket)
+        assert mock_websocket not in support_utils.active_connections
 
     def test_multiple_connections(self, support_utils):
         """Test handling multiple active connections."""
         # Add multiple connections
-        connections = {}
-        for i in range(5):
+        connections = []
+        for _ in range(5):
             mock_websocket = MagicMock()
-            connection_id = i
-            support_utils.active_connections[connection_id] = mock_websocket
-            connections[connection_id] = mock_websocket
+            support_utils.active_connections.add(mock_websocket)
+            connections.append(mock_websocket)
 
         assert len(support_utils.active_connections) == 5  # noqa: PLR2004
 
         # Verify all connections are present
-        for connection_id, websocket in connections.items():
-            assert support_utils.active_connections[connection_id] is websocket
+        for websocket in connections:
+            assert websocket in support_utils.active_connections
 
     def test_multiple_subscriptions(self, support_utils):
         """Test handling multiple MQTT subscriptions."""
@@ -134,3 +138,19 @@ class TestSupportUtils:
         assert support_utils.mqtt_config.host == "test-host"
         assert support_utils.mqtt_config.port == 9999  # noqa: PLR2004
         assert support_utils.mqtt_client is mock_client
+
+    async def test_publish_request(self, support_utils):
+        """Test that client requests are published as JSON bytes to the input topic."""
+        support_utils.config_obj = Config(client_id="test-station")
+        support_utils.mqtt_client = AsyncMock()
+        request = messages.ClientRequest(
+            id=uuid.uuid4(), text="turn on the lights", room="kitchen", output_topic="assistant/kitchen/output"
+        )
+
+        await support_utils.publish_request(request)
+
+        support_utils.mqtt_client.publish.assert_awaited_once_with(
+            "assistant/ground_station/all/test-station/input",
+            request.model_dump_json().encode(),
+            qos=1,
+        )